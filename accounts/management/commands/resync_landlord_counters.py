@@ -0,0 +1,17 @@
+"""
+Management command to recount the denormalised landlord property/unit counters
+Run nightly from cron with: python manage.py resync_landlord_counters
+"""
+from django.core.management.base import BaseCommand
+from accounts.models import LandlordProfile
+
+
+class Command(BaseCommand):
+    help = 'Recount LandlordProfile.property_count and unit_count from properties and units'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--landlord', type=int, help='Only resync this landlord profile id')
+
+    def handle(self, *args, **options):
+        updated = LandlordProfile.resync_counters(landlord_id=options.get('landlord'))
+        self.stdout.write(self.style.SUCCESS(f'{updated} landlord profile(s) resynced.'))
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-16 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['role', 'date_joined'], name='user_role_joined_idx'),
+        ),
+    ]
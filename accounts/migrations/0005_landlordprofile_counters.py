@@ -0,0 +1,47 @@
+# Generated by Django 4.2.7 on 2026-10-16 09:00
+
+from django.db import migrations, models
+
+
+def backfill_counters(apps, schema_editor):
+    from django.db.models import Count, IntegerField, OuterRef, Subquery
+    from django.db.models.functions import Coalesce
+
+    LandlordProfile = apps.get_model('accounts', 'LandlordProfile')
+    Property = apps.get_model('properties', 'Property')
+    Unit = apps.get_model('properties', 'Unit')
+
+    def count_of(queryset, field):
+        return Coalesce(Subquery(
+            queryset.filter(**{field: OuterRef('pk')}).order_by().values(field).annotate(
+                c=Count('pk')
+            ).values('c'),
+            output_field=IntegerField()
+        ), 0)
+
+    LandlordProfile.objects.update(
+        property_count=count_of(Property.objects.all(), 'landlord'),
+        unit_count=count_of(Unit.objects.all(), 'unit_property__landlord'),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_user_user_joined_desc_idx'),
+        ('properties', '0003_unit_uniq_unit_per_property'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='landlordprofile',
+            name='property_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='landlordprofile',
+            name='unit_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
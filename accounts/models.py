@@ -22,6 +22,10 @@ class User(AbstractUser):
         db_table = 'users'
         verbose_name = 'User'
         verbose_name_plural = 'Users'
+        indexes = [
+            models.Index(fields=['role', 'date_joined'], name='user_role_joined_idx'),
+            models.Index(fields=['-date_joined'], name='user_joined_desc_idx'),
+        ]
     
     def __str__(self):
         return f"{self.username} ({self.get_role_display()})"
@@ -71,6 +75,10 @@ class LandlordProfile(models.Model):
     smtp_password = models.CharField(max_length=255, blank=True)
     smtp_use_tls = models.BooleanField(default=True)
     
+    # Denormalised counters, maintained by properties.signals
+    property_count = models.PositiveIntegerField(default=0)
+    unit_count = models.PositiveIntegerField(default=0)
+    
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
@@ -91,9 +99,23 @@ class LandlordProfile(models.Model):
     
     @property
     def units_used(self):
-        """Count total units across all properties"""
-        from properties.models import Unit
-        return Unit.objects.filter(unit_property__landlord=self).count()
+        """Total units across all properties, from the maintained counter"""
+        return self.unit_count
+
+    @classmethod
+    def resync_counters(cls, landlord_id=None):
+        """Recount property_count/unit_count from the source tables; returns profiles updated"""
+        from django.db.models import OuterRef
+        from core.expressions import SubqueryCount
+        from properties.models import Property, Unit
+
+        profiles = cls.objects.all()
+        if landlord_id is not None:
+            profiles = profiles.filter(pk=landlord_id)
+        return profiles.update(
+            property_count=SubqueryCount(Property.objects.filter(landlord=OuterRef('pk')).values('pk')),
+            unit_count=SubqueryCount(Unit.objects.filter(unit_property__landlord=OuterRef('pk')).values('pk')),
+        )
     
     @property
     def units_remaining(self):
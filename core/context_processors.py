@@ -18,11 +18,13 @@ def subscription_context(request):
     if not hasattr(request.user, 'is_landlord') or not request.user.is_landlord:
         return context
     
-    # Get landlord profile safely
-    try:
-        landlord = request.user.landlord_profile
-    except:
-        return context
+    # Get landlord profile safely - prefer the one TenantMiddleware already loaded
+    landlord = getattr(request, 'landlord', None)
+    if landlord is None:
+        try:
+            landlord = request.user.landlord_profile
+        except:
+            return context
     
     if not landlord:
         return context
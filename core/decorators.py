@@ -0,0 +1,24 @@
+from functools import wraps
+from django.shortcuts import redirect
+from django.contrib import messages
+from django.contrib.auth.views import redirect_to_login
+
+
+def landlord_required(view_func):
+    """
+    Decorator that ensures only logged-in Landlord users can access the view.
+    Applied once at URLconf level so views don't repeat the role checks.
+    """
+    @wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        user = request.user
+        if not user.is_authenticated:
+            return redirect_to_login(request.get_full_path())
+        
+        if not user.is_landlord:
+            messages.error(request, 'Access denied.')
+            return redirect('demo:home')
+        
+        return view_func(request, *args, **kwargs)
+    
+    return wrapper
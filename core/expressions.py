@@ -0,0 +1,47 @@
+from django.db.models import DateField, Func, IntegerField, Subquery
+
+
+class DateAdd(Func):
+    """
+    Shift a date expression by a whole number of days or months inside the database.
+    F() + timedelta can't express calendar months, and on SQLite it yields a
+    datetime string rather than a date, so emit per-backend date arithmetic.
+    Month steps clamp to the end of a shorter month (Jan 31 + 1 month = Feb 28/29),
+    matching relativedelta.
+    """
+    output_field = DateField()
+
+    def __init__(self, expression, days=0, months=0, **extra):
+        self.amount, self.unit = (int(months), 'month') if months else (int(days), 'day')
+        super().__init__(expression, **extra)
+
+    def as_sql(self, compiler, connection, **extra_context):
+        template = f"DATE_ADD(%(expressions)s, INTERVAL {self.amount} {self.unit.upper()})"
+        return super().as_sql(compiler, connection, template=template, **extra_context)
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        template = f"(%(expressions)s + INTERVAL '{self.amount} {self.unit}s')::date"
+        return super().as_sql(compiler, connection, template=template, **extra_context)
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        sql, params = compiler.compile(self.source_expressions[0])
+        if self.unit == 'day':
+            return f"date({sql}, '+{self.amount} days')", params
+        # date(x, '+N months') overflows month ends (Jan 31 -> Mar 2/3), so when the
+        # day of month changes, clamp to the last day of the target month instead
+        shifted = f"'+{self.amount} months'"
+        sql = (
+            f"CASE WHEN strftime('%%d', {sql}, {shifted}) = strftime('%%d', {sql}) "
+            f"THEN date({sql}, {shifted}) "
+            f"ELSE date({sql}, 'start of month', '+{self.amount + 1} months', '-1 day') END"
+        )
+        return sql, (*params, *params, *params, *params)
+
+
+class SubqueryCount(Subquery):
+    """
+    Row count of a correlated subquery. Counting per outer row this way avoids
+    joining the child table into the outer query and de-duplicating with DISTINCT.
+    """
+    template = '(SELECT COUNT(*) FROM (%(subquery)s) _count)'
+    output_field = IntegerField()
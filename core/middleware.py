@@ -15,10 +15,18 @@ class TenantMiddleware(MiddlewareMixin):
         request.landlord = None
         request.tenant = None
         request.superadmin = None
+        request._roles = {'superadmin': False, 'landlord': False, 'tenant': False}
 
         if not request.user.is_authenticated:
             return None
 
+        # Resolve role flags once; decorators read these instead of the user properties
+        request._roles = {
+            'superadmin': request.user.is_superadmin,
+            'landlord': request.user.is_landlord,
+            'tenant': request.user.is_tenant,
+        }
+
         # Import here to avoid circular imports
         from accounts.models import LandlordProfile, TenantProfile
 
@@ -41,7 +49,10 @@ class TenantMiddleware(MiddlewareMixin):
         # Handle Landlord Users
         if hasattr(request.user, 'is_landlord') and request.user.is_landlord:
             try:
-                request.landlord = request.user.landlord_profile
+                # Join the plan up front; units_used reads the profile's unit_count counter
+                request.landlord = LandlordProfile.objects.select_related(
+                    'subscription__plan'
+                ).get(user=request.user)
             except LandlordProfile.DoesNotExist:
                 # Create profile if doesn't exist
                 request.landlord = LandlordProfile.objects.create(user=request.user)
@@ -1,7 +1,8 @@
 from django.shortcuts import render, redirect
 from django.contrib.auth.decorators import login_required
-from django.db.models import Sum, F
-from datetime import date, timedelta
+from django.utils import timezone
+from django.db.models import F, Sum
+from datetime import date, datetime, time, timedelta
 from decimal import Decimal
 from properties.models import Property, Unit
 from tenants_mgmt.models import Lease
@@ -38,8 +39,9 @@ def super_admin_dashboard(request):
     total_landlords = LandlordProfile.objects.count()
     active_subs = Subscription.objects.filter(end_date__gte=date.today()).count()
     total_properties = Property.objects.count()
-    total_units = Unit.objects.count()
-    occupied = Unit.objects.filter(lease__status='active').distinct().count()
+    unit_stats = Unit.objects.all().occupancy_stats()
+    total_units = unit_stats['total']
+    occupied = unit_stats['occupied']
 
     total_revenue = Payment.objects.filter(status='confirmed').aggregate(total=Sum('amount'))['total'] or 0
 
@@ -105,28 +107,26 @@ def landlord_dashboard(request):
 
     # Property stats
     total_properties = Property.objects.filter(landlord=landlord).count()
-    total_units = Unit.objects.filter(unit_property__landlord=landlord).count()
-    occupied_units = Unit.objects.filter(
-        unit_property__landlord=landlord,
-        lease__status='active'
-    ).distinct().count()
+    unit_stats = Unit.objects.filter(unit_property__landlord=landlord).occupancy_stats()
+    total_units = unit_stats['total']
+    occupied_units = unit_stats['occupied']
     vacant_units = total_units - occupied_units
 
-    # Financial stats (current month)
-    current_month = date.today().month
-    current_year = date.today().year
+    # Financial stats (current month) - range predicates so the date indexes apply
+    current_month = date.today().replace(day=1)
+    next_month = (current_month + timedelta(days=32)).replace(day=1)
 
     rent_collected = Payment.objects.filter(
         invoice__lease__unit__unit_property__landlord=landlord,
-        payment_date__month=current_month,
-        payment_date__year=current_year,
+        payment_date__gte=timezone.make_aware(datetime.combine(current_month, time.min)),
+        payment_date__lt=timezone.make_aware(datetime.combine(next_month, time.min)),
         status='confirmed'
     ).aggregate(total=Sum('amount'))['total'] or 0
 
     total_expenses = Expense.objects.filter(
         landlord=landlord,
-        expense_date__month=current_month,
-        expense_date__year=current_year
+        expense_date__gte=current_month,
+        expense_date__lt=next_month
     ).aggregate(total=Sum('amount'))['total'] or 0
 
     net_profit = Decimal(str(rent_collected)) - Decimal(str(total_expenses))
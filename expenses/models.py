@@ -37,6 +37,9 @@ class Expense(models.Model):
     class Meta:
         db_table = 'expenses'
         ordering = ['-expense_date', '-created_at']
+        indexes = [
+            models.Index(fields=['landlord', 'expense_date'], name='exp_landlord_date_idx'),
+        ]
         verbose_name = 'Expense'
         verbose_name_plural = 'Expenses'
     
@@ -3,6 +3,7 @@ from django.contrib.auth.mixins import LoginRequiredMixin
 from django.views import View
 from django.contrib import messages
 from django.utils import timezone
+from datetime import timedelta
 from django.db import transaction
 from .models import Expense
 from properties.models import Property
@@ -40,8 +41,8 @@ class ExpenseListView(LoginRequiredMixin, View):
             try:
                 filter_date = timezone.datetime.strptime(month_filter, '%Y-%m').date()
                 expenses = expenses.filter(
-                    expense_date__year=filter_date.year,
-                    expense_date__month=filter_date.month
+                    expense_date__gte=filter_date,
+                    expense_date__lt=(filter_date + timedelta(days=32)).replace(day=1)
                 )
             except ValueError:
                 pass
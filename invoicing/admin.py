@@ -1,4 +1,5 @@
 from django.contrib import admin
+from django.db import transaction
 from .models import Invoice
 
 
@@ -70,9 +71,12 @@ class InvoiceAdmin(admin.ModelAdmin):
     
     actions = ['mark_as_paid', 'mark_as_overdue']
     
+    @transaction.atomic
     def mark_as_paid(self, request, queryset):
+        # One transaction, so the monthly summary refresh runs once per landlord-month
         count = 0
-        for invoice in queryset:
+        # Stream the selection so large bulk actions don't load every invoice at once
+        for invoice in queryset.iterator(chunk_size=500):
             invoice.amount_paid = invoice.total_amount
             invoice.save()
             count += 1
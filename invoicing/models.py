@@ -6,6 +6,12 @@ from decimal import Decimal
 from datetime import date
 
 
+class InvoiceQuerySet(models.QuerySet):
+    def with_balance(self):
+        """Annotate each invoice's outstanding balance so it can be summed/filtered in SQL"""
+        return self.annotate(balance=models.F('total_amount') - models.F('amount_paid'))
+
+
 class Invoice(models.Model):
     """
     Monthly invoice/bill for a tenant.
@@ -48,12 +54,19 @@ class Invoice(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = InvoiceQuerySet.as_manager()
+
     class Meta:
         db_table = 'invoices'
         ordering = ['-billing_month', '-created_at']
         verbose_name = 'Invoice'
         verbose_name_plural = 'Invoices'
         unique_together = ['lease', 'billing_month']
+        indexes = [
+            models.Index(fields=['lease', 'status'], name='inv_lease_status_idx'),
+            models.Index(fields=['status', 'due_date'], name='inv_status_due_idx'),
+            models.Index(fields=['billing_month'], name='inv_billing_month_idx'),
+        ]
 
     def save(self, *args, **kwargs):
         """Auto-generate invoice number and calculate totals"""
@@ -108,8 +121,15 @@ class Invoice(models.Model):
 
     @property
     def balance(self):
+        # Prefer the value annotated by Invoice.objects.with_balance()
+        if '_balance' in self.__dict__:
+            return self._balance
         return self.total_amount - self.amount_paid
 
+    @balance.setter
+    def balance(self, value):
+        self._balance = value
+
     @property
     def is_paid(self):
         return self.status == 'paid'
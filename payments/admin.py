@@ -52,18 +52,17 @@ class PaymentAdmin(admin.ModelAdmin):
     
     def confirm_payments(self, request, queryset):
         count = 0
-        for payment in queryset:
-            if payment.status != 'confirmed':
-                payment.confirm_payment()
-                count += 1
+        # Stream the selection so large bulk actions don't load every payment at once
+        for payment in queryset.exclude(status='confirmed').iterator(chunk_size=500):
+            payment.confirm_payment()
+            count += 1
         self.message_user(request, f'{count} payment(s) confirmed.')
     confirm_payments.short_description = 'Confirm selected payments'
     
     def fail_payments(self, request, queryset):
         count = 0
-        for payment in queryset:
-            if payment.status != 'failed':
-                payment.fail_payment()
-                count += 1
+        for payment in queryset.exclude(status='failed').iterator(chunk_size=500):
+            payment.fail_payment()
+            count += 1
         self.message_user(request, f'{count} payment(s) marked as failed.')
     fail_payments.short_description = 'Mark selected payments as failed'
\ No newline at end of file
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-16 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0002_unit_last_reading_date_unit_last_water_reading_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='unit',
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name='unit',
+            constraint=models.UniqueConstraint(fields=('unit_property', 'unit_number'), name='uniq_unit_per_property'),
+        ),
+    ]
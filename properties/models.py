@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models import Count, Exists, OuterRef, Q
 from decimal import Decimal
 from accounts.models import LandlordProfile
 
@@ -52,6 +53,31 @@ class Property(models.Model):
         return ((total - occupied) / total) * 100
 
 
+def _active_lease_exists():
+    """EXISTS test for an active lease on the outer unit - no join, no DISTINCT"""
+    from tenants_mgmt.models import Lease
+    return Exists(Lease.objects.filter(unit=OuterRef('pk'), status='active'))
+
+
+class UnitQuerySet(models.QuerySet):
+    def with_active_lease(self):
+        """Annotate has_active_lease on each unit"""
+        return self.annotate(has_active_lease=_active_lease_exists())
+
+    def occupied(self):
+        return self.filter(_active_lease_exists())
+
+    def vacant(self):
+        return self.filter(~_active_lease_exists())
+
+    def occupancy_stats(self):
+        """Total and occupied unit counts in one aggregate"""
+        return self.with_active_lease().aggregate(
+            total=Count('id'),
+            occupied=Count('id', filter=Q(has_active_lease=True))
+        )
+
+
 class Unit(models.Model):
     """
     Individual rental unit within a property.
@@ -90,9 +116,13 @@ class Unit(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = UnitQuerySet.as_manager()
+
     class Meta:
         db_table = 'units'
-        unique_together = ['unit_property', 'unit_number']
+        constraints = [
+            models.UniqueConstraint(fields=['unit_property', 'unit_number'], name='uniq_unit_per_property'),
+        ]
         ordering = ['unit_number']
         verbose_name = 'Unit'
         verbose_name_plural = 'Units'
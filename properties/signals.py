@@ -0,0 +1,35 @@
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from accounts.models import LandlordProfile
+from .models import Property, Unit
+
+# Decrements stop at zero so the PositiveIntegerFields stay valid; any drift
+# is corrected by the resync_landlord_counters management command.
+
+@receiver(post_save, sender=Property)
+def count_property_created(sender, instance, created, **kwargs):
+    if created:
+        LandlordProfile.objects.filter(pk=instance.landlord_id).update(property_count=F('property_count') + 1)
+
+
+@receiver(post_delete, sender=Property)
+def count_property_deleted(sender, instance, **kwargs):
+    LandlordProfile.objects.filter(
+        pk=instance.landlord_id, property_count__gt=0
+    ).update(property_count=F('property_count') - 1)
+
+
+@receiver(post_save, sender=Unit)
+def count_unit_created(sender, instance, created, **kwargs):
+    if created:
+        LandlordProfile.objects.filter(
+            properties=instance.unit_property_id
+        ).update(unit_count=F('unit_count') + 1)
+
+
+@receiver(post_delete, sender=Unit)
+def count_unit_deleted(sender, instance, **kwargs):
+    LandlordProfile.objects.filter(
+        properties=instance.unit_property_id, unit_count__gt=0
+    ).update(unit_count=F('unit_count') - 1)
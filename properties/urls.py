@@ -1,19 +1,20 @@
 from django.urls import path
+from core.decorators import landlord_required
 from . import views
 
 urlpatterns = [
     # Dashboard
-    path('', views.DashboardView.as_view(), name='dashboard'),
+    path('', landlord_required(views.DashboardView.as_view()), name='dashboard'),
     
     # Properties
-    path('properties/', views.PropertyListView.as_view(), name='property_list'),
-    path('properties/create/', views.PropertyCreateView.as_view(), name='property_create'),
-    path('properties/<int:pk>/', views.PropertyDetailView.as_view(), name='property_detail'),
-    path('properties/<int:pk>/edit/', views.PropertyUpdateView.as_view(), name='property_update'),
-    path('properties/<int:pk>/delete/', views.PropertyDeleteView.as_view(), name='property_delete'),
+    path('properties/', landlord_required(views.PropertyListView.as_view()), name='property_list'),
+    path('properties/create/', landlord_required(views.PropertyCreateView.as_view()), name='property_create'),
+    path('properties/<int:pk>/', landlord_required(views.PropertyDetailView.as_view()), name='property_detail'),
+    path('properties/<int:pk>/edit/', landlord_required(views.PropertyUpdateView.as_view()), name='property_update'),
+    path('properties/<int:pk>/delete/', landlord_required(views.PropertyDeleteView.as_view()), name='property_delete'),
     
     # Units
-    path('units/create/', views.UnitCreateView.as_view(), name='unit_create'),
-    path('units/<int:pk>/edit/', views.UnitUpdateView.as_view(), name='unit_update'),
-    path('units/<int:pk>/delete/', views.UnitDeleteView.as_view(), name='unit_delete'),
+    path('units/create/', landlord_required(views.UnitCreateView.as_view()), name='unit_create'),
+    path('units/<int:pk>/edit/', landlord_required(views.UnitUpdateView.as_view()), name='unit_update'),
+    path('units/<int:pk>/delete/', landlord_required(views.UnitDeleteView.as_view()), name='unit_delete'),
 ]
\ No newline at end of file
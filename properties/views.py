@@ -1,24 +1,22 @@
 from django.shortcuts import render, redirect, get_object_or_404
-from django.contrib.auth.mixins import LoginRequiredMixin
 from django.views import View
 from django.contrib import messages
+from django.db import IntegrityError, transaction
+from django.http import Http404
 from .models import Property, Unit
 from invoicing.models import Invoice
 from payments.models import Payment
 from expenses.models import Expense
 from accounts.models import LandlordProfile
-from django.db.models import Sum, Q
+from django.db.models import Sum
 from django.utils import timezone
+from datetime import timedelta
 
 
-class DashboardView(LoginRequiredMixin, View):
+class DashboardView(View):
     """Main landlord dashboard with statistics and recent activity"""
     
     def get(self, request):
-        if not request.user.is_landlord:
-            messages.error(request, 'Access denied. Landlord account required.')
-            return redirect('demo:home')
-        
         # Get landlord profile - fallback if middleware didn't attach it
         if not hasattr(request, 'landlord') or request.landlord is None:
             try:
@@ -47,11 +45,11 @@ class DashboardView(LoginRequiredMixin, View):
         
         # Calculate statistics
         total_properties = Property.objects.filter(landlord=landlord).count()
-        total_units = Unit.objects.filter(unit_property__landlord=landlord).count()
-        occupied_units = Unit.objects.filter(
-            unit_property__landlord=landlord,
-            lease__status='active'
-        ).distinct().count()
+        
+        # Total and occupied units in one pass - EXISTS avoids the JOIN + DISTINCT on leases
+        unit_stats = Unit.objects.filter(unit_property__landlord=landlord).occupancy_stats()
+        total_units = unit_stats['total']
+        occupied_units = unit_stats['occupied']
         
         # Occupancy rate
         occupancy_rate = (occupied_units / total_units * 100) if total_units > 0 else 0
@@ -64,20 +62,16 @@ class DashboardView(LoginRequiredMixin, View):
         ).aggregate(total=Sum('amount'))['total'] or 0
         
         # Total arrears (all unpaid/partially paid invoices)
-        arrears_invoices = Invoice.objects.filter(
+        pending_amount = Invoice.objects.with_balance().filter(
             lease__unit__unit_property__landlord=landlord,
             status__in=['pending', 'overdue', 'partial']
-        )
-        
-        pending_amount = 0
-        for invoice in arrears_invoices:
-            pending_amount += (invoice.total_amount - invoice.amount_paid)
+        ).aggregate(total=Sum('balance'))['total'] or 0
         
         # Expenses for current month
         total_expenses = Expense.objects.filter(
             landlord=landlord,
-            expense_date__month=current_month.month,
-            expense_date__year=current_month.year
+            expense_date__gte=current_month,
+            expense_date__lt=(current_month + timedelta(days=32)).replace(day=1)
         ).aggregate(total=Sum('amount'))['total'] or 0
         
         # Net profit
@@ -123,14 +117,10 @@ class DashboardView(LoginRequiredMixin, View):
         return render(request, 'landlord/dashboard.html', context)
 
 
-class PropertyListView(LoginRequiredMixin, View):
+class PropertyListView(View):
     """List all properties for the landlord"""
     
     def get(self, request):
-        if not request.user.is_landlord:
-            messages.error(request, 'Access denied.')
-            return redirect('demo:home')
-        
         properties = Property.objects.filter(
             landlord=request.landlord
         ).prefetch_related('units')
@@ -140,21 +130,13 @@ class PropertyListView(LoginRequiredMixin, View):
         })
 
 
-class PropertyCreateView(LoginRequiredMixin, View):
+class PropertyCreateView(View):
     """Create a new property"""
     
     def get(self, request):
-        if not request.user.is_landlord:
-            messages.error(request, 'Access denied.')
-            return redirect('demo:home')
-        
         return render(request, 'landlord/property_form.html')
     
     def post(self, request):
-        if not request.user.is_landlord:
-            messages.error(request, 'Access denied.')
-            return redirect('demo:home')
-        
         name = request.POST.get('name')
         location = request.POST.get('location')
         description = request.POST.get('description', '')
@@ -174,14 +156,10 @@ class PropertyCreateView(LoginRequiredMixin, View):
         return redirect('property_detail', pk=property_obj.pk)
 
 
-class PropertyDetailView(LoginRequiredMixin, View):
+class PropertyDetailView(View):
     """View property details and units"""
     
     def get(self, request, pk):
-        if not request.user.is_landlord:
-            messages.error(request, 'Access denied.')
-            return redirect('demo:home')
-        
         property_obj = get_object_or_404(
             Property,
             pk=pk,
@@ -196,14 +174,10 @@ class PropertyDetailView(LoginRequiredMixin, View):
         })
 
 
-class PropertyUpdateView(LoginRequiredMixin, View):
+class PropertyUpdateView(View):
     """Update property details"""
     
     def get(self, request, pk):
-        if not request.user.is_landlord:
-            messages.error(request, 'Access denied.')
-            return redirect('demo:home')
-        
         property_obj = get_object_or_404(
             Property,
             pk=pk,
@@ -215,16 +189,6 @@ class PropertyUpdateView(LoginRequiredMixin, View):
         })
     
     def post(self, request, pk):
-        if not request.user.is_landlord:
-            messages.error(request, 'Access denied.')
-            return redirect('demo:home')
-        
-        property_obj = get_object_or_404(
-            Property,
-            pk=pk,
-            landlord=request.landlord
-        )
-        
         name = request.POST.get('name')
         location = request.POST.get('location')
         description = request.POST.get('description', '')
@@ -233,47 +197,49 @@ class PropertyUpdateView(LoginRequiredMixin, View):
             messages.error(request, 'Property name and location are required.')
             return redirect('property_update', pk=pk)
         
-        property_obj.name = name
-        property_obj.location = location
-        property_obj.description = description
-        property_obj.save()
+        # Update in place - the landlord filter doubles as the ownership check
+        updated = Property.objects.filter(
+            pk=pk,
+            landlord=request.landlord
+        ).update(
+            name=name,
+            location=location,
+            description=description,
+            updated_at=timezone.now()
+        )
+        
+        if not updated:
+            raise Http404
         
         messages.success(request, 'Property updated successfully!')
         return redirect('property_detail', pk=pk)
 
 
-class PropertyDeleteView(LoginRequiredMixin, View):
+class PropertyDeleteView(View):
     """Delete a property"""
     
     def post(self, request, pk):
-        if not request.user.is_landlord:
-            messages.error(request, 'Access denied.')
-            return redirect('demo:home')
-        
-        property_obj = get_object_or_404(
-            Property,
-            pk=pk,
-            landlord=request.landlord
-        )
+        properties = Property.objects.filter(pk=pk, landlord=request.landlord)
+        property_obj = properties.only('name').first()
+        if property_obj is None:
+            raise Http404
         
         property_name = property_obj.name
-        property_obj.delete()
+        properties.delete()
         
         messages.success(request, f'Property "{property_name}" deleted successfully!')
         return redirect('property_list')
 
 
-class UnitCreateView(LoginRequiredMixin, View):
+class UnitCreateView(View):
     """Create a new unit"""
     
     def get(self, request):
-        if not request.user.is_landlord:
-            messages.error(request, 'Access denied.')
-            return redirect('demo:home')
-        
-        properties = Property.objects.filter(landlord=request.landlord)
+        properties = list(Property.objects.filter(
+            landlord=request.landlord
+        ).values_list('id', 'name', 'location').order_by('name'))
         
-        if not properties.exists():
+        if not properties:
             messages.warning(request, 'Please create a property first before adding units.')
             return redirect('property_create')
         
@@ -282,12 +248,8 @@ class UnitCreateView(LoginRequiredMixin, View):
         })
     
     def post(self, request):
-        if not request.user.is_landlord:
-            messages.error(request, 'Access denied.')
-            return redirect('demo:home')
-        
         # Check unit limit
-        current_units = Unit.objects.filter(unit_property__landlord=request.landlord).count()
+        current_units = request.landlord.units_used
         
         if request.landlord.subscription:
             max_units = request.landlord.subscription.plan.max_units
@@ -320,42 +282,40 @@ class UnitCreateView(LoginRequiredMixin, View):
             landlord=request.landlord
         )
         
-        # Check for duplicate unit number in same property
-        if Unit.objects.filter(unit_property=property_obj, unit_number=unit_number).exists():
+        # Create unit - duplicate unit numbers are rejected by the uniq_unit_per_property constraint
+        try:
+            with transaction.atomic():
+                Unit.objects.create(
+                    unit_property=property_obj,
+                    unit_number=unit_number,
+                    unit_type=unit_type,
+                    monthly_rent=monthly_rent,
+                    garbage_fee=garbage_fee,
+                    water_billing_type=water_billing_type,
+                    water_fixed_amount=water_fixed_amount,
+                    water_rate_per_unit=water_rate_per_unit
+                )
+        except IntegrityError:
             messages.error(request, f'Unit "{unit_number}" already exists in this property.')
             return redirect('unit_create')
         
-        # Create unit
-        unit = Unit.objects.create(
-            unit_property=property_obj,
-            unit_number=unit_number,
-            unit_type=unit_type,
-            monthly_rent=monthly_rent,
-            garbage_fee=garbage_fee,
-            water_billing_type=water_billing_type,
-            water_fixed_amount=water_fixed_amount,
-            water_rate_per_unit=water_rate_per_unit
-        )
-        
         messages.success(request, f'Unit "{unit_number}" created successfully!')
         return redirect('property_detail', pk=property_obj.pk)
 
 
-class UnitUpdateView(LoginRequiredMixin, View):
+class UnitUpdateView(View):
     """Update unit details"""
     
     def get(self, request, pk):
-        if not request.user.is_landlord:
-            messages.error(request, 'Access denied.')
-            return redirect('demo:home')
-        
         unit = get_object_or_404(
             Unit,
             pk=pk,
             unit_property__landlord=request.landlord
         )
         
-        properties = Property.objects.filter(landlord=request.landlord)
+        properties = list(Property.objects.filter(
+            landlord=request.landlord
+        ).values_list('id', 'name', 'location').order_by('name'))
         
         return render(request, 'landlord/unit_form.html', {
             'unit': unit,
@@ -363,10 +323,6 @@ class UnitUpdateView(LoginRequiredMixin, View):
         })
     
     def post(self, request, pk):
-        if not request.user.is_landlord:
-            messages.error(request, 'Access denied.')
-            return redirect('demo:home')
-        
         unit = get_object_or_404(
             Unit,
             pk=pk,
@@ -395,17 +351,7 @@ class UnitUpdateView(LoginRequiredMixin, View):
             landlord=request.landlord
         )
         
-        # Check for duplicate unit number (excluding current unit)
-        duplicate = Unit.objects.filter(
-            unit_property=property_obj,
-            unit_number=unit_number
-        ).exclude(pk=pk)
-        
-        if duplicate.exists():
-            messages.error(request, f'Unit "{unit_number}" already exists in this property.')
-            return redirect('unit_update', pk=pk)
-        
-        # Update unit
+        # Update unit - duplicate unit numbers are rejected by the uniq_unit_per_property constraint
         unit.unit_property = property_obj
         unit.unit_number = unit_number
         unit.unit_type = unit_type
@@ -414,22 +360,23 @@ class UnitUpdateView(LoginRequiredMixin, View):
         unit.water_billing_type = water_billing_type
         unit.water_fixed_amount = water_fixed_amount
         unit.water_rate_per_unit = water_rate_per_unit
-        unit.save()
+        try:
+            with transaction.atomic():
+                unit.save()
+        except IntegrityError:
+            messages.error(request, f'Unit "{unit_number}" already exists in this property.')
+            return redirect('unit_update', pk=pk)
         
         messages.success(request, 'Unit updated successfully!')
         return redirect('property_detail', pk=unit.unit_property.pk)
 
 
-class UnitDeleteView(LoginRequiredMixin, View):
+class UnitDeleteView(View):
     """Delete a unit"""
     
     def post(self, request, pk):
-        if not request.user.is_landlord:
-            messages.error(request, 'Access denied.')
-            return redirect('demo:home')
-        
         unit = get_object_or_404(
-            Unit,
+            Unit.objects.only('unit_number', 'unit_property_id'),
             pk=pk,
             unit_property__landlord=request.landlord
         )
@@ -437,9 +384,9 @@ class UnitDeleteView(LoginRequiredMixin, View):
         # Check if unit has active lease
         if unit.is_occupied():
             messages.error(request, 'Cannot delete unit with active lease. Terminate lease first.')
-            return redirect('property_detail', pk=unit.unit_property.pk)
+            return redirect('property_detail', pk=unit.unit_property_id)
         
-        property_pk = unit.unit_property.pk
+        property_pk = unit.unit_property_id
         unit_number = unit.unit_number
         unit.delete()
         
@@ -10,6 +10,7 @@ class ReminderAdmin(admin.ModelAdmin):
     raw_id_fields = ['landlord', 'reminder_property']
     readonly_fields = ['created_at', 'updated_at', 'last_sent']
     date_hierarchy = 'reminder_date'
+    ordering = ['reminder_date', 'reminder_time']
     
     fieldsets = (
         ('Reminder Information', {
@@ -0,0 +1,38 @@
+"""
+Management command to roll overdue recurring reminders forward to their next send date.
+It only reschedules: nothing is sent and last_sent is left untouched.
+Run from cron with: python manage.py reschedule_reminders
+"""
+from django.core.management.base import BaseCommand
+from django.db.models import Case, DateField, F, When
+from django.utils import timezone
+from core.expressions import DateAdd
+from reminders.models import Reminder
+
+
+class Command(BaseCommand):
+    help = 'Move next_send_date forward one step for past-due recurring reminders in a single UPDATE'
+
+    def handle(self, *args, **kwargs):
+        now = timezone.now()
+        next_send = F('next_send_date')
+
+        # One UPDATE for every past-due recurring reminder - the CASE picks the step per frequency.
+        # One-off reminders have no next date, so they are left for the send path to handle.
+        updated = Reminder.objects.filter(
+            is_active=True,
+            next_send_date__lt=now.date()
+        ).exclude(frequency='once').update(
+            updated_at=now,
+            next_send_date=Case(
+                When(frequency='daily', then=DateAdd(next_send, days=1)),
+                When(frequency='weekly', then=DateAdd(next_send, days=7)),
+                When(frequency='monthly', then=DateAdd(next_send, months=1)),
+                When(frequency='quarterly', then=DateAdd(next_send, months=3)),
+                When(frequency='yearly', then=DateAdd(next_send, months=12)),
+                default=next_send,
+                output_field=DateField(),
+            ),
+        )
+
+        self.stdout.write(self.style.SUCCESS(f'{updated} reminder(s) rescheduled.'))
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.7 on 2026-10-16 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reminders', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='reminder',
+            options={'verbose_name': 'Reminder', 'verbose_name_plural': 'Reminders'},
+        ),
+        migrations.AddIndex(
+            model_name='reminder',
+            index=models.Index(fields=['landlord', 'is_active', 'next_send_date', 'reminder_time'], name='rem_landlord_act_next_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reminder',
+            index=models.Index(fields=['landlord', 'is_active', '-last_sent'], name='rem_landlord_inact_sent_idx'),
+        ),
+    ]
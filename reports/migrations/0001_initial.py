@@ -0,0 +1,67 @@
+# Generated by Django 4.2.7 on 2026-10-16 09:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def backfill_summaries(apps, schema_editor):
+    from django.db.models import Sum
+    from django.db.models.functions import TruncMonth
+
+    Invoice = apps.get_model('invoicing', 'Invoice')
+    Expense = apps.get_model('expenses', 'Expense')
+    LandlordMonthlySummary = apps.get_model('reports', 'LandlordMonthlySummary')
+
+    rows = {}
+    invoice_totals = Invoice.objects.order_by().annotate(
+        month=TruncMonth('billing_month')
+    ).values('lease__unit__unit_property__landlord_id', 'month').annotate(
+        billed=Sum('total_amount'), collected=Sum('amount_paid'),
+    )
+    for row in invoice_totals:
+        key = (row['lease__unit__unit_property__landlord_id'], row['month'])
+        rows[key] = LandlordMonthlySummary(
+            landlord_id=key[0], billing_month=key[1],
+            billed=row['billed'] or 0, collected=row['collected'] or 0,
+        )
+    expense_totals = Expense.objects.order_by().annotate(
+        month=TruncMonth('expense_date')
+    ).values('landlord_id', 'month').annotate(total=Sum('amount'))
+    for row in expense_totals:
+        key = (row['landlord_id'], row['month'])
+        summary = rows.setdefault(key, LandlordMonthlySummary(landlord_id=key[0], billing_month=key[1]))
+        summary.expenses = row['total'] or 0
+
+    LandlordMonthlySummary.objects.bulk_create(rows.values(), batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('accounts', '0002_initial'),
+        ('invoicing', '0003_invoice_report_indexes'),
+        ('expenses', '0002_expense_exp_landlord_date_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LandlordMonthlySummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('billing_month', models.DateField(help_text='First day of the summarised month')),
+                ('billed', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('collected', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('expenses', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('landlord', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='monthly_summaries', to='accounts.landlordprofile')),
+            ],
+            options={
+                'db_table': 'landlord_monthly_summaries',
+                'ordering': ['-billing_month'],
+                'unique_together': {('landlord', 'billing_month')},
+            },
+        ),
+        migrations.RunPython(backfill_summaries, migrations.RunPython.noop),
+    ]
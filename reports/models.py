@@ -1,3 +1,101 @@
-from django.db import models
+from datetime import date, timedelta
+from django.db import connection, models
+from django.db.models import Sum
+from django.db.models.functions import TruncMonth
+from accounts.models import LandlordProfile
 
-# Create your models here.
+
+def month_start(value):
+    """First day of the month for a date or an ISO date string"""
+    if isinstance(value, str):
+        value = date.fromisoformat(value[:10])
+    return value.replace(day=1)
+
+
+class LandlordMonthlySummary(models.Model):
+    """
+    Pre-aggregated billed / collected / expense totals per landlord and month.
+    Kept fresh by signals on invoices and expenses (one refresh per touched
+    landlord-month per transaction), rebuilt nightly by the
+    aggregate_landlord_monthly management command.
+    """
+    landlord = models.ForeignKey(LandlordProfile, on_delete=models.CASCADE, related_name='monthly_summaries')
+    billing_month = models.DateField(help_text='First day of the summarised month')
+    billed = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    collected = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    expenses = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'landlord_monthly_summaries'
+        unique_together = ['landlord', 'billing_month']
+        ordering = ['-billing_month']
+
+    def __str__(self):
+        return f"{self.landlord} - {self.billing_month.strftime('%B %Y')}"
+
+    @classmethod
+    def refresh(cls, landlord_id=None, month=None):
+        """
+        Recompute summary rows from invoices and expenses, optionally scoped to
+        one landlord and/or one month. Returns the number of rows written.
+        """
+        from invoicing.models import Invoice
+        from expenses.models import Expense
+
+        invoices = Invoice.objects.order_by()
+        expenses = Expense.objects.order_by()
+        summaries = cls.objects.all()
+        if landlord_id is not None:
+            invoices = invoices.filter(lease__unit__unit_property__landlord_id=landlord_id)
+            expenses = expenses.filter(landlord_id=landlord_id)
+            summaries = summaries.filter(landlord_id=landlord_id)
+        if month is not None:
+            month = month_start(month)
+            next_month = (month + timedelta(days=32)).replace(day=1)
+            invoices = invoices.filter(billing_month__gte=month, billing_month__lt=next_month)
+            expenses = expenses.filter(expense_date__gte=month, expense_date__lt=next_month)
+            summaries = summaries.filter(billing_month=month)
+
+        rows = {}
+        invoice_totals = invoices.annotate(
+            month=TruncMonth('billing_month')
+        ).values('lease__unit__unit_property__landlord_id', 'month').annotate(
+            billed=Sum('total_amount'),
+            collected=Sum('amount_paid'),
+        )
+        for row in invoice_totals:
+            key = (row['lease__unit__unit_property__landlord_id'], row['month'])
+            rows[key] = cls(
+                landlord_id=key[0], billing_month=key[1],
+                billed=row['billed'] or 0, collected=row['collected'] or 0,
+            )
+
+        expense_totals = expenses.annotate(
+            month=TruncMonth('expense_date')
+        ).values('landlord_id', 'month').annotate(total=Sum('amount'))
+        for row in expense_totals:
+            key = (row['landlord_id'], row['month'])
+            summary = rows.setdefault(key, cls(landlord_id=key[0], billing_month=key[1]))
+            summary.expenses = row['total'] or 0
+
+        # Upsert current totals, then drop rows whose month no longer has data.
+        # MySQL's ON DUPLICATE KEY UPDATE takes no conflict target.
+        conflict_target = {}
+        if connection.features.supports_update_conflicts_with_target:
+            conflict_target['unique_fields'] = ['landlord', 'billing_month']
+        cls.objects.bulk_create(
+            rows.values(),
+            batch_size=1000,
+            update_conflicts=True,
+            update_fields=['billed', 'collected', 'expenses', 'updated_at'],
+            **conflict_target,
+        )
+        stale = [
+            pk for pk, landlord, billing_month in
+            summaries.values_list('pk', 'landlord_id', 'billing_month')
+            if (landlord, billing_month) not in rows
+        ]
+        if stale:
+            cls.objects.filter(pk__in=stale).delete()
+        return len(rows)
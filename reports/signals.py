@@ -0,0 +1,132 @@
+import threading
+from django.core.signals import request_started
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from expenses.models import Expense
+from invoicing.models import Invoice
+from tenants_mgmt.models import Lease
+from .models import LandlordMonthlySummary, month_start
+
+# Refresh batch for the open transaction on this thread
+_local = threading.local()
+
+
+class _PendingRefresh:
+    """
+    Landlord-months touched in one transaction, refreshed once after it commits.
+    Saved invoices are keyed by lease and resolved to landlords in one query when
+    the batch runs; deleted invoices are resolved straight away, while the lease
+    still exists, so cascaded deletes are counted too.
+    """
+
+    def __init__(self):
+        self.lease_months = set()
+        self.landlord_months = set()
+        self._lease_landlords = {}
+
+    def add_lease_month(self, lease_id, billing_month):
+        if lease_id is not None and billing_month:
+            self.lease_months.add((lease_id, month_start(billing_month)))
+
+    def add_landlord_month(self, landlord_id, billing_month):
+        if landlord_id is not None and billing_month:
+            self.landlord_months.add((landlord_id, month_start(billing_month)))
+
+    def landlord_for(self, lease_id):
+        """Landlord id of a lease, looked up once per batch"""
+        if lease_id not in self._lease_landlords:
+            self._lease_landlords[lease_id] = Lease.objects.filter(pk=lease_id).values_list(
+                'unit__unit_property__landlord_id', flat=True
+            ).first()
+        return self._lease_landlords[lease_id]
+
+    def __call__(self):
+        if getattr(_local, 'pending', None) is self:
+            _local.pending = None
+        keys = set(self.landlord_months)
+        unresolved = {lease_id for lease_id, _ in self.lease_months} - self._lease_landlords.keys()
+        if unresolved:
+            self._lease_landlords.update(Lease.objects.filter(pk__in=unresolved).values_list(
+                'pk', 'unit__unit_property__landlord_id'
+            ))
+        keys.update(
+            (self._lease_landlords[lease_id], month) for lease_id, month in self.lease_months
+            if self._lease_landlords.get(lease_id) is not None
+        )
+        for landlord_id, month in keys:
+            LandlordMonthlySummary.refresh(landlord_id=landlord_id, month=month)
+
+
+def _pending_refresh():
+    """Batch for the current transaction; outside atomic() a fresh one the caller flushes"""
+    if not transaction.get_connection().in_atomic_block:
+        # Anything still held here belongs to a transaction that rolled back
+        _local.pending = None
+        return _PendingRefresh()
+    pending = getattr(_local, 'pending', None)
+    if pending is None:
+        pending = _local.pending = _PendingRefresh()
+        transaction.on_commit(pending)
+    return pending
+
+
+def _flush_if_autocommit(pending):
+    # Outside atomic() there's nothing to wait for, so refresh straight away
+    if not transaction.get_connection().in_atomic_block:
+        pending()
+
+
+@receiver(request_started)
+def reset_pending_refresh(sender, **kwargs):
+    """Never carry a batch orphaned by a rollback into the next request"""
+    _local.pending = None
+
+
+def _previous_values(sender, instance, update_fields, fields):
+    """Stored values of fields for an edited row, or None for inserts and unrelated updates"""
+    if instance.pk is None or (update_fields is not None and not set(fields) & set(update_fields)):
+        return None
+    return sender.objects.filter(pk=instance.pk).values_list(*fields).first()
+
+
+@receiver(pre_save, sender=Invoice)
+def remember_invoice_month(sender, instance, update_fields=None, **kwargs):
+    """Keep the stored lease/month so a move to another month refreshes both"""
+    instance._summary_previous = _previous_values(sender, instance, update_fields, ['lease_id', 'billing_month'])
+
+
+@receiver(post_save, sender=Invoice)
+def refresh_saved_invoice_month(sender, instance, **kwargs):
+    """
+    Payments confirm by saving the invoice, so this also covers collections.
+    Queryset update() calls bypass this; the aggregate command reconciles them.
+    """
+    pending = _pending_refresh()
+    pending.add_lease_month(instance.lease_id, instance.billing_month)
+    previous = instance.__dict__.pop('_summary_previous', None)
+    if previous:
+        pending.add_lease_month(*previous)
+    _flush_if_autocommit(pending)
+
+
+@receiver(post_delete, sender=Invoice)
+def refresh_deleted_invoice_month(sender, instance, **kwargs):
+    pending = _pending_refresh()
+    pending.add_landlord_month(pending.landlord_for(instance.lease_id), instance.billing_month)
+    _flush_if_autocommit(pending)
+
+
+@receiver(pre_save, sender=Expense)
+def remember_expense_month(sender, instance, update_fields=None, **kwargs):
+    instance._summary_previous = _previous_values(sender, instance, update_fields, ['landlord_id', 'expense_date'])
+
+
+@receiver([post_save, post_delete], sender=Expense)
+def refresh_expense_month(sender, instance, **kwargs):
+    pending = _pending_refresh()
+    pending.add_landlord_month(instance.landlord_id, instance.expense_date)
+    previous = instance.__dict__.pop('_summary_previous', None)
+    if previous:
+        pending.add_landlord_month(*previous)
+    _flush_if_autocommit(pending)
@@ -1,15 +1,79 @@
 from django.shortcuts import render, redirect
+from django.http import HttpResponseBadRequest
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.views import View
 from django.contrib import messages
+from django.core.paginator import Paginator
 from django.utils import timezone
-from django.db.models import Sum, Count, Q, Avg
-from datetime import timedelta
+from django.db.models import Sum, Count, Q, Avg, Case, When, Value, CharField, FilteredRelation, OuterRef
+from datetime import date, timedelta
 from invoicing.models import Invoice
 from payments.models import Payment
 from expenses.models import Expense
 from properties.models import Property, Unit
-from tenants_mgmt.models import Lease
+from core.expressions import SubqueryCount
+from .models import LandlordMonthlySummary
+
+# Arrears invoices listed per page on the aging report
+ARREARS_PAGE_SIZE = 100
+
+# Columns needed to list invoices with their tenant and unit on the reports
+INVOICE_LIST_FIELDS = [
+    'id', 'invoice_number', 'billing_month', 'due_date', 'status', 'total_amount', 'amount_paid',
+    'lease__tenant__user__first_name', 'lease__tenant__user__last_name',
+    'lease__tenant__user__email', 'lease__tenant__user__phone_number',
+    'lease__unit__unit_number', 'lease__unit__unit_property__name',
+]
+
+
+def _report_period(request):
+    """start_date/end_date query params as dates, defaulting to the current year to date"""
+    today = timezone.now().date()
+    start_date = request.GET.get('start_date')
+    end_date = request.GET.get('end_date')
+    start_date = date.fromisoformat(start_date) if start_date else today.replace(month=1, day=1)
+    end_date = date.fromisoformat(end_date) if end_date else today
+    return start_date, end_date
+
+
+def _monthly_revenue(landlord, start):
+    """Billed/collected totals per billing month since start, read from the summary table"""
+    return [
+        {'month': month, 'billed': billed, 'collected': collected}
+        for month, billed, collected in LandlordMonthlySummary.objects.filter(
+            landlord=landlord,
+            billing_month__gte=start
+        ).values_list('billing_month', 'billed', 'collected').order_by('billing_month')
+    ]
+
+
+def _total_arrears(landlord):
+    """Outstanding balance across all unpaid/partially paid invoices"""
+    return Invoice.objects.with_balance().filter(
+        lease__unit__unit_property__landlord=landlord,
+        status__in=['pending', 'overdue', 'partial']
+    ).aggregate(total=Sum('balance'))['total'] or 0
+
+
+def _expense_stats(landlord, start, current_month, last_month, current_year):
+    """Current month, last month and year-to-date expenses from a single scan"""
+    next_month = (current_month + timedelta(days=32)).replace(day=1)
+    expenses = Expense.objects.filter(
+        landlord=landlord,
+        expense_date__gte=start
+    ).aggregate(
+        # Range predicates keep (landlord, expense_date) usable instead of EXTRACT per row
+        current_month=Sum('amount', filter=Q(
+            expense_date__gte=current_month,
+            expense_date__lt=next_month
+        )),
+        last_month=Sum('amount', filter=Q(
+            expense_date__gte=last_month,
+            expense_date__lt=current_month
+        )),
+        year_to_date=Sum('amount', filter=Q(expense_date__gte=current_year)),
+    )
+    return {period: total or 0 for period, total in expenses.items()}
 
 
 class ReportsDashboardView(LoginRequiredMixin, View):
@@ -28,72 +92,38 @@ class ReportsDashboardView(LoginRequiredMixin, View):
         last_month = (current_month - timedelta(days=1)).replace(day=1)
         current_year = today.replace(month=1, day=1)
         
-        # Revenue summary
+        # One aggregate per section, all on the request's connection
+        period_start = min(last_month, current_year)
+        monthly_revenue = _monthly_revenue(landlord, period_start)
+        unit_stats = Unit.objects.filter(unit_property__landlord=landlord).occupancy_stats()
+        total_arrears = _total_arrears(landlord)
+        expense_stats = _expense_stats(landlord, period_start, current_month, last_month, current_year)
+        
+        # Revenue summary - the monthly series (at most 13 rows) drives every period
+        revenue_by_month = {row['month']: row for row in monthly_revenue}
+        empty_month = {'billed': None, 'collected': None}
+        year_to_date = [row for row in monthly_revenue if row['month'] >= current_year]
         revenue_stats = {
-            'current_month': Invoice.objects.filter(
-                lease__unit__unit_property__landlord=landlord,
-                billing_month=current_month
-            ).aggregate(
-                billed=Sum('total_amount'),
-                collected=Sum('amount_paid')
-            ),
-            'last_month': Invoice.objects.filter(
-                lease__unit__unit_property__landlord=landlord,
-                billing_month=last_month
-            ).aggregate(
-                billed=Sum('total_amount'),
-                collected=Sum('amount_paid')
-            ),
-            'year_to_date': Invoice.objects.filter(
-                lease__unit__unit_property__landlord=landlord,
-                billing_month__gte=current_year
-            ).aggregate(
-                billed=Sum('total_amount'),
-                collected=Sum('amount_paid')
-            ),
+            'current_month': revenue_by_month.get(current_month, empty_month),
+            'last_month': revenue_by_month.get(last_month, empty_month),
+            'year_to_date': {
+                'billed': sum(row['billed'] or 0 for row in year_to_date) if year_to_date else None,
+                'collected': sum(row['collected'] or 0 for row in year_to_date) if year_to_date else None,
+            },
         }
         
         # Occupancy stats
-        total_units = Unit.objects.filter(unit_property__landlord=landlord).count()
-        occupied_units = Unit.objects.filter(
-            unit_property__landlord=landlord,
-            lease__status='active'
-        ).distinct().count()
+        total_units = unit_stats['total']
+        occupied_units = unit_stats['occupied']
         
         occupancy_rate = (occupied_units / total_units * 100) if total_units > 0 else 0
         
-        # Arrears
-        total_arrears = 0
-        arrears_invoices = Invoice.objects.filter(
-            lease__unit__unit_property__landlord=landlord,
-            status__in=['pending', 'overdue', 'partial']
-        )
-        for inv in arrears_invoices:
-            total_arrears += inv.balance
-        
-        # Expenses
-        expense_stats = {
-            'current_month': Expense.objects.filter(
-                landlord=landlord,
-                expense_date__year=current_month.year,
-                expense_date__month=current_month.month
-            ).aggregate(total=Sum('amount'))['total'] or 0,
-            'last_month': Expense.objects.filter(
-                landlord=landlord,
-                expense_date__year=last_month.year,
-                expense_date__month=last_month.month
-            ).aggregate(total=Sum('amount'))['total'] or 0,
-            'year_to_date': Expense.objects.filter(
-                landlord=landlord,
-                expense_date__gte=current_year
-            ).aggregate(total=Sum('amount'))['total'] or 0,
-        }
-        
         # Net profit
         net_profit_current = (revenue_stats['current_month']['collected'] or 0) - expense_stats['current_month']
         
         context = {
             'revenue_stats': revenue_stats,
+            'monthly_revenue': monthly_revenue,
             'occupancy_rate': occupancy_rate,
             'total_units': total_units,
             'occupied_units': occupied_units,
@@ -118,39 +148,36 @@ class RevenueReportView(LoginRequiredMixin, View):
         landlord = request.landlord
         
         # Get date range from query params
-        start_date = request.GET.get('start_date')
-        end_date = request.GET.get('end_date')
-        
-        # Default to current year
-        if not start_date:
-            start_date = timezone.now().date().replace(month=1, day=1)
-        else:
-            start_date = timezone.datetime.strptime(start_date, '%Y-%m-%d').date()
-        
-        if not end_date:
-            end_date = timezone.now().date()
-        else:
-            end_date = timezone.datetime.strptime(end_date, '%Y-%m-%d').date()
+        try:
+            start_date, end_date = _report_period(request)
+        except ValueError:
+            return HttpResponseBadRequest('Dates must be in YYYY-MM-DD format.')
         
         # Revenue by month
-        invoices = Invoice.objects.filter(
+        invoices = Invoice.objects.with_balance().filter(
             lease__unit__unit_property__landlord=landlord,
             billing_month__gte=start_date,
             billing_month__lte=end_date
-        )
+        ).select_related(
+            'lease__tenant__user',
+            'lease__unit__unit_property'
+        ).only(*INVOICE_LIST_FIELDS)
         
         # Revenue by property
+        # Both sums share one date-filtered join onto invoices
         revenue_by_property = Property.objects.filter(
             landlord=landlord
         ).annotate(
-            total_billed=Sum('units__lease__invoices__total_amount', filter=Q(
-                units__lease__invoices__billing_month__gte=start_date,
-                units__lease__invoices__billing_month__lte=end_date
-            )),
-            total_collected=Sum('units__lease__invoices__amount_paid', filter=Q(
-                units__lease__invoices__billing_month__gte=start_date,
-                units__lease__invoices__billing_month__lte=end_date
-            ))
+            period_invoices=FilteredRelation(
+                'units__lease__invoices',
+                condition=Q(
+                    units__lease__invoices__billing_month__gte=start_date,
+                    units__lease__invoices__billing_month__lte=end_date
+                )
+            )
+        ).annotate(
+            total_billed=Sum('period_invoices__total_amount'),
+            total_collected=Sum('period_invoices__amount_paid')
         )
         
         context = {
@@ -175,46 +202,58 @@ class ArrearsReportView(LoginRequiredMixin, View):
         today = timezone.now().date()
         
         # Get all unpaid/partially paid invoices
-        arrears_invoices = Invoice.objects.filter(
+        arrears_invoices = Invoice.objects.with_balance().filter(
             lease__unit__unit_property__landlord=landlord,
             status__in=['pending', 'overdue', 'partial']
+        )
+        
+        # Aging buckets expressed as due_date ranges so the DB can bucket (and use indexes)
+        aging_buckets = {
+            'current': Q(due_date__gte=today),  # Not yet due
+            '1-30': Q(due_date__lt=today, due_date__gte=today - timedelta(days=30)),
+            '31-60': Q(due_date__lt=today - timedelta(days=30), due_date__gte=today - timedelta(days=60)),
+            '61-90': Q(due_date__lt=today - timedelta(days=60), due_date__gte=today - timedelta(days=90)),
+            '90+': Q(due_date__lt=today - timedelta(days=90)),
+        }
+        
+        # Calculate totals - one query returns every bucket's balance
+        bucket_sums = arrears_invoices.aggregate(**{
+            f'bucket_{i}': Sum('balance', filter=condition)
+            for i, condition in enumerate(aging_buckets.values())
+        })
+        totals = {
+            bucket: bucket_sums[f'bucket_{i}'] or 0
+            for i, bucket in enumerate(aging_buckets)
+        }
+        
+        # Invoices are listed a page at a time, each tagged with its bucket.
+        # ORDER BY stays: with the LIMIT it is a top-N over inv_status_due_idx rather than
+        # a full sort, and it keeps the oldest debts first and each bucket in due order.
+        listed = arrears_invoices.annotate(
+            aging_bucket=Case(
+                *[When(condition, then=Value(bucket)) for bucket, condition in aging_buckets.items()],
+                output_field=CharField()
+            )
         ).select_related(
             'lease__tenant__user',
             'lease__unit__unit_property'
-        ).order_by('due_date')
-        
-        # Calculate aging buckets
-        aging_data = {
-            'current': [],  # Not yet due
-            '1-30': [],     # 1-30 days overdue
-            '31-60': [],    # 31-60 days overdue
-            '61-90': [],    # 61-90 days overdue
-            '90+': [],      # 90+ days overdue
-        }
+        ).only(*INVOICE_LIST_FIELDS).order_by('due_date')
+        page = Paginator(listed, ARREARS_PAGE_SIZE).get_page(request.GET.get('page'))
+        params = request.GET.copy()
+        params.pop('page', None)
         
-        for invoice in arrears_invoices:
-            days_overdue = (today - invoice.due_date).days
-            
-            if days_overdue <= 0:
-                aging_data['current'].append(invoice)
-            elif days_overdue <= 30:
-                aging_data['1-30'].append(invoice)
-            elif days_overdue <= 60:
-                aging_data['31-60'].append(invoice)
-            elif days_overdue <= 90:
-                aging_data['61-90'].append(invoice)
-            else:
-                aging_data['90+'].append(invoice)
-        
-        # Calculate totals
-        totals = {}
-        for bucket, invoices in aging_data.items():
-            totals[bucket] = sum(inv.balance for inv in invoices)
+        aging_data = {bucket: [] for bucket in aging_buckets}
+        for invoice in page:
+            aging_data[invoice.aging_bucket].append(invoice)
         
         context = {
             'aging_data': aging_data,
             'totals': totals,
             'grand_total': sum(totals.values()),
+            # The totals cover every invoice; the lists only the current page
+            'page_obj': page,
+            'page_query': params.urlencode(),
+            'arrears_count': page.paginator.count,
         }
         
         return render(request, 'landlord/arrears_report.html', context)
@@ -230,13 +269,18 @@ class OccupancyReportView(LoginRequiredMixin, View):
         
         landlord = request.landlord
         
-        # Occupancy by property
-        properties = Property.objects.filter(landlord=landlord).prefetch_related('units')
+        # Occupancy by property - per-property counts as correlated subqueries, so the
+        # units x leases join never needs a DISTINCT to undo its fan-out
+        property_units = Unit.objects.filter(unit_property=OuterRef('pk'))
+        properties = Property.objects.filter(landlord=landlord).annotate(
+            total_units_c=SubqueryCount(property_units.values('pk')),
+            occupied_units_c=SubqueryCount(property_units.occupied().values('pk'))
+        )
         
         property_stats = []
         for prop in properties:
-            total = prop.get_total_units()
-            occupied = prop.get_occupied_units()
+            total = prop.total_units_c
+            occupied = prop.occupied_units_c
             vacant = total - occupied
             
             property_stats.append({
@@ -273,18 +317,10 @@ class ExpensesReportView(LoginRequiredMixin, View):
         landlord = request.landlord
         
         # Get date range
-        start_date = request.GET.get('start_date')
-        end_date = request.GET.get('end_date')
-        
-        if not start_date:
-            start_date = timezone.now().date().replace(month=1, day=1)
-        else:
-            start_date = timezone.datetime.strptime(start_date, '%Y-%m-%d').date()
-        
-        if not end_date:
-            end_date = timezone.now().date()
-        else:
-            end_date = timezone.datetime.strptime(end_date, '%Y-%m-%d').date()
+        try:
+            start_date, end_date = _report_period(request)
+        except ValueError:
+            return HttpResponseBadRequest('Dates must be in YYYY-MM-DD format.')
         
         # Expenses by category
         expenses_by_category = Expense.objects.filter(
@@ -331,18 +367,10 @@ class ProfitReportView(LoginRequiredMixin, View):
         landlord = request.landlord
         
         # Get date range
-        start_date = request.GET.get('start_date')
-        end_date = request.GET.get('end_date')
-        
-        if not start_date:
-            start_date = timezone.now().date().replace(month=1, day=1)
-        else:
-            start_date = timezone.datetime.strptime(start_date, '%Y-%m-%d').date()
-        
-        if not end_date:
-            end_date = timezone.now().date()
-        else:
-            end_date = timezone.datetime.strptime(end_date, '%Y-%m-%d').date()
+        try:
+            start_date, end_date = _report_period(request)
+        except ValueError:
+            return HttpResponseBadRequest('Dates must be in YYYY-MM-DD format.')
         
         # Revenue (payments received)
         total_revenue = Payment.objects.filter(
@@ -1,5 +1,12 @@
+from collections import defaultdict
+from functools import partial
 from django.contrib import admin
-from .models import SubscriptionPlan, Subscription, SubscriptionPayment
+from django.db import transaction
+from django.db.models import Count, Value
+from django.db.models.functions import Greatest
+from django.utils import timezone
+from core.expressions import DateAdd
+from .models import SubscriptionPlan, Subscription, SubscriptionPayment, SubscriptionRevenueDaily
 
 
 @admin.register(SubscriptionPlan)
@@ -86,10 +93,38 @@ class SubscriptionPaymentAdmin(admin.ModelAdmin):
     actions = ['confirm_payments']
     
     def confirm_payments(self, request, queryset):
-        count = 0
-        for payment in queryset:
-            if payment.status != 'confirmed':
-                payment.confirm_payment()
-                count += 1
+        now = timezone.now()
+        pending = queryset.exclude(status='confirmed')
+        
+        with transaction.atomic():
+            # Each confirmed payment buys 30 days, so group subscriptions by how many they get
+            renewals = defaultdict(list)
+            for subscription_id, payments in pending.order_by().values(
+                'subscription_id'
+            ).annotate(
+                payments=Count('id')
+            ).values_list('subscription_id', 'payments'):
+                renewals[payments].append(subscription_id)
+            
+            count = pending.update(status='confirmed', paid_at=now)
+            # update() skips the post_save refresh, so recompute today's revenue row here
+            transaction.on_commit(partial(SubscriptionRevenueDaily.refresh, day=timezone.localdate(now)))
+            
+            # Extend from today if already lapsed, otherwise from the current end date
+            for payments, subscription_ids in renewals.items():
+                Subscription.objects.filter(id__in=subscription_ids).update(
+                    end_date=DateAdd(Greatest('end_date', Value(now.date())), days=30 * payments),
+                    status='active',
+                    updated_at=now
+                )
+        
         self.message_user(request, f'{count} payment(s) confirmed and subscriptions extended.')
-    confirm_payments.short_description = 'Confirm selected payments'
\ No newline at end of file
+    confirm_payments.short_description = 'Confirm selected payments'
+
+@admin.register(SubscriptionRevenueDaily)
+class SubscriptionRevenueDailyAdmin(admin.ModelAdmin):
+    list_display = ['day', 'plan', 'total', 'payment_count', 'updated_at']
+    list_filter = ['plan']
+    date_hierarchy = 'day'
+    list_select_related = ['plan']
+    readonly_fields = ['updated_at']
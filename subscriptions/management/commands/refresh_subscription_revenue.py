@@ -0,0 +1,18 @@
+"""
+Management command to rebuild the daily subscription revenue table
+Run nightly from cron with: python manage.py refresh_subscription_revenue
+"""
+from datetime import date
+from django.core.management.base import BaseCommand
+from subscriptions.models import SubscriptionRevenueDaily
+
+
+class Command(BaseCommand):
+    help = 'Rebuild SubscriptionRevenueDaily rows from confirmed subscription payments'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--day', type=date.fromisoformat, help='Only rebuild this day (YYYY-MM-DD)')
+
+    def handle(self, *args, **options):
+        written = SubscriptionRevenueDaily.refresh(day=options.get('day'))
+        self.stdout.write(self.style.SUCCESS(f'{written} daily revenue row(s) refreshed.'))
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-16 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('subscriptions', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='subscription',
+            name='end_date',
+            field=models.DateField(db_index=True),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 4.2.7 on 2026-10-16 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('subscriptions', '0002_alter_subscription_end_date'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='subscription',
+            name='start_date',
+            field=models.DateField(auto_now_add=True, db_index=True),
+        ),
+        migrations.AddIndex(
+            model_name='subscription',
+            index=models.Index(fields=['status', 'end_date'], name='sub_status_end_idx'),
+        ),
+    ]
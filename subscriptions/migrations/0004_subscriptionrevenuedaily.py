@@ -0,0 +1,55 @@
+# Generated by Django 4.2.7 on 2026-10-16 09:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def backfill_revenue(apps, schema_editor):
+    from django.db.models import Count, Sum
+    from django.db.models.functions import TruncDate
+
+    SubscriptionPayment = apps.get_model('subscriptions', 'SubscriptionPayment')
+    SubscriptionRevenueDaily = apps.get_model('subscriptions', 'SubscriptionRevenueDaily')
+
+    rows = SubscriptionPayment.objects.filter(
+        status='confirmed', paid_at__isnull=False
+    ).order_by().annotate(day=TruncDate('paid_at')).values(
+        'day', 'subscription__plan_id'
+    ).annotate(total=Sum('amount'), count=Count('id'))
+
+    SubscriptionRevenueDaily.objects.bulk_create([
+        SubscriptionRevenueDaily(
+            day=row['day'], plan_id=row['subscription__plan_id'],
+            total=row['total'], payment_count=row['count'],
+        )
+        for row in rows
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('subscriptions', '0003_subscription_start_date_status_end_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SubscriptionRevenueDaily',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('total', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('payment_count', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('plan', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_revenue', to='subscriptions.subscriptionplan')),
+            ],
+            options={
+                'verbose_name': 'Daily Subscription Revenue',
+                'verbose_name_plural': 'Daily Subscription Revenue',
+                'db_table': 'subscription_revenue_daily',
+                'ordering': ['-day'],
+                'unique_together': {('day', 'plan')},
+            },
+        ),
+        migrations.RunPython(backfill_revenue, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-16 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('subscriptions', '0004_subscriptionrevenuedaily'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='subscriptionpayment',
+            index=models.Index(fields=['status', 'paid_at'], name='subpay_status_paid_idx'),
+        ),
+    ]
@@ -1,8 +1,12 @@
+from django.core.cache import cache
 from django.db import models
 from django.utils import timezone
 from datetime import timedelta
 
 
+ACTIVE_PLANS_CACHE_KEY = 'active_subscription_plans'
+
+
 class SubscriptionPlan(models.Model):
     PLAN_CHOICES = [
         ('PLUS', 'PLUS'),
@@ -27,6 +31,15 @@ class SubscriptionPlan(models.Model):
     
     def __str__(self):
         return f"{self.name} - {self.max_units} units - KES {self.monthly_price}"
+    
+    @classmethod
+    def get_active_plans(cls):
+        """Active plans, cached until a plan is saved or deleted"""
+        return cache.get_or_set(
+            ACTIVE_PLANS_CACHE_KEY,
+            lambda: list(cls.objects.filter(is_active=True)),
+            60 * 60
+        )
 
 
 class Subscription(models.Model):
@@ -40,8 +53,8 @@ class Subscription(models.Model):
     landlord = models.ForeignKey('accounts.LandlordProfile', on_delete=models.CASCADE, related_name='subscriptions')
     plan = models.ForeignKey(SubscriptionPlan, on_delete=models.PROTECT)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='trial')
-    start_date = models.DateField(auto_now_add=True)
-    end_date = models.DateField()
+    start_date = models.DateField(auto_now_add=True, db_index=True)
+    end_date = models.DateField(db_index=True)
     auto_renew = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -51,6 +64,9 @@ class Subscription(models.Model):
         ordering = ['-created_at']
         verbose_name = 'Subscription'
         verbose_name_plural = 'Subscriptions'
+        indexes = [
+            models.Index(fields=['status', 'end_date'], name='sub_status_end_idx'),
+        ]
     
     def save(self, *args, **kwargs):
         if not self.end_date:
@@ -103,6 +119,10 @@ class SubscriptionPayment(models.Model):
         ordering = ['-created_at']
         verbose_name = 'Subscription Payment'
         verbose_name_plural = 'Subscription Payments'
+        indexes = [
+            models.Index(fields=['status', 'paid_at'], name='subpay_status_paid_idx'),
+            models.Index(fields=['-paid_at'], name='subpay_paid_desc_idx'),
+        ]
     
     def __str__(self):
         return f"Payment {self.transaction_id} - KES {self.amount} ({self.status})"
@@ -119,4 +139,65 @@ class SubscriptionPayment(models.Model):
             subscription.end_date = subscription.end_date + timedelta(days=30)
         
         subscription.status = 'active'
-        subscription.save()
\ No newline at end of file
+        subscription.save()
+
+class SubscriptionRevenueDaily(models.Model):
+    """
+    Confirmed subscription revenue per day and plan.
+    Kept fresh by signals on SubscriptionPayment and rebuilt nightly by the
+    refresh_subscription_revenue management command.
+    """
+    day = models.DateField()
+    plan = models.ForeignKey(SubscriptionPlan, on_delete=models.CASCADE, related_name='daily_revenue')
+    total = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    payment_count = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        db_table = 'subscription_revenue_daily'
+        unique_together = ['day', 'plan']
+        ordering = ['-day']
+        verbose_name = 'Daily Subscription Revenue'
+        verbose_name_plural = 'Daily Subscription Revenue'
+    
+    def __str__(self):
+        return f"{self.day} - {self.plan.name}: KES {self.total}"
+    
+    @classmethod
+    def refresh(cls, day=None):
+        """
+        Recompute rows from confirmed payments, optionally for a single day.
+        Returns the number of rows written.
+        """
+        from django.db.models import Count, Sum
+        from django.db.models.functions import TruncDate
+        
+        payments = SubscriptionPayment.objects.filter(status='confirmed', paid_at__isnull=False).order_by()
+        summaries = cls.objects.all()
+        if day is not None:
+            payments = payments.filter(paid_at__date=day)
+            summaries = summaries.filter(day=day)
+        
+        rows = [
+            cls(day=row['day'], plan_id=row['subscription__plan_id'], total=row['total'], payment_count=row['count'])
+            for row in payments.annotate(day=TruncDate('paid_at')).values(
+                'day', 'subscription__plan_id'
+            ).annotate(total=Sum('amount'), count=Count('id'))
+        ]
+        
+        # Upsert current totals, then drop rows whose day/plan no longer has payments
+        cls.objects.bulk_create(
+            rows,
+            batch_size=1000,
+            update_conflicts=True,
+            unique_fields=['day', 'plan'],
+            update_fields=['total', 'payment_count', 'updated_at'],
+        )
+        current = {(row.day, row.plan_id) for row in rows}
+        stale = [
+            pk for pk, row_day, plan_id in summaries.values_list('pk', 'day', 'plan_id')
+            if (row_day, plan_id) not in current
+        ]
+        if stale:
+            cls.objects.filter(pk__in=stale).delete()
+        return len(rows)
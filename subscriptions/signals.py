@@ -0,0 +1,22 @@
+from functools import partial
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+from .models import ACTIVE_PLANS_CACHE_KEY, SubscriptionPayment, SubscriptionPlan, SubscriptionRevenueDaily
+
+
+@receiver([post_save, post_delete], sender=SubscriptionPlan)
+def invalidate_active_plans(sender, **kwargs):
+    """Drop the cached plan list whenever a plan changes"""
+    cache.delete(ACTIVE_PLANS_CACHE_KEY)
+
+
+@receiver([post_save, post_delete], sender=SubscriptionPayment)
+def refresh_revenue_day(sender, instance, **kwargs):
+    """Recompute the payment's revenue day once the surrounding transaction commits"""
+    if instance.paid_at is None:
+        return
+    day = timezone.localdate(instance.paid_at)
+    transaction.on_commit(partial(SubscriptionRevenueDaily.refresh, day=day))
@@ -7,7 +7,7 @@ from .models import SubscriptionPlan
 
 class PlansView(View):
     def get(self, request):
-        plans = SubscriptionPlan.objects.filter(is_active=True)
+        plans = SubscriptionPlan.get_active_plans()
         return render(request, 'subscriptions/plans.html', {'plans': plans})
 
 
@@ -23,5 +23,5 @@ class SubscriptionExpiredView(LoginRequiredMixin, View):
 
 class UpgradeSubscriptionView(LoginRequiredMixin, View):
     def get(self, request):
-        plans = SubscriptionPlan.objects.filter(is_active=True)
+        plans = SubscriptionPlan.get_active_plans()
         return render(request, 'subscriptions/upgrade.html', {'plans': plans})
\ No newline at end of file
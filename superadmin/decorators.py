@@ -14,13 +14,20 @@ def superadmin_required(view_func):
             messages.error(request, 'Please login to continue.')
             return redirect('accounts:login')
         
+        # Role flags resolved once per request by TenantMiddleware
+        roles = getattr(request, '_roles', None) or {
+            'superadmin': request.user.is_superadmin,
+            'landlord': request.user.is_landlord,
+            'tenant': request.user.is_tenant,
+        }
+        
         # Check if user is superadmin (is_superuser OR role == 'superadmin')
-        if not request.user.is_superadmin:
+        if not roles['superadmin']:
             messages.error(request, 'Access denied. Super Admin privileges required.')
             # Redirect based on role
-            if request.user.is_landlord:
+            if roles['landlord']:
                 return redirect('dashboard')
-            elif request.user.is_tenant:
+            elif roles['tenant']:
                 return redirect('tenants:portal')
             else:
                 return redirect('demo:home')
@@ -0,0 +1,37 @@
+from datetime import timedelta
+from decimal import Decimal
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from accounts.models import User
+from subscriptions.models import SubscriptionPlan, SubscriptionRevenueDaily
+
+
+class DashboardViewTests(TestCase):
+    """Super admin dashboard renders with and without revenue rows"""
+
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_superuser('admin', 'admin@example.com', 'pass')
+        self.client.force_login(self.admin)
+
+    def test_dashboard_without_revenue(self):
+        response = self.client.get(reverse('superadmin:dashboard'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['total_revenue'], 0)
+
+    def test_dashboard_sums_revenue(self):
+        plan, _ = SubscriptionPlan.objects.get_or_create(
+            name='PLUS', defaults={'max_units': 10, 'monthly_price': Decimal('1000.00')}
+        )
+        today = timezone.now().date()
+        SubscriptionRevenueDaily.objects.create(day=today, plan=plan, total=Decimal('1000.00'), payment_count=1)
+        SubscriptionRevenueDaily.objects.create(
+            day=today - timedelta(days=60), plan=plan, total=Decimal('500.00'), payment_count=1
+        )
+
+        response = self.client.get(reverse('superadmin:dashboard'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['total_revenue'], Decimal('1500.00'))
+        self.assertEqual(response.context['revenue_30d'], Decimal('1000.00'))
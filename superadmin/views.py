@@ -1,6 +1,8 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib import messages
-from django.db.models import Sum, Count, Q
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db.models import BooleanField, Case, Count, F, Q, Sum, Value, When
 from django.db.models.functions import TruncMonth
 from django.utils import timezone
 from datetime import timedelta
@@ -8,93 +10,83 @@ from .decorators import superadmin_required
 
 # Import models from other apps
 from accounts.models import User, LandlordProfile, TenantProfile
-from subscriptions.models import Subscription, SubscriptionPlan, SubscriptionPayment
+from subscriptions.models import Subscription, SubscriptionPlan, SubscriptionPayment, SubscriptionRevenueDaily
 from properties.models import Property, Unit
 from payments.models import Payment
 from invoicing.models import Invoice
 
+# Seconds the superadmin aggregates are served from cache before being recomputed
+DASHBOARD_CACHE_TIMEOUT = 120
+REVENUE_CACHE_TIMEOUT = 300
 
-@superadmin_required
-def dashboard(request):
-    """
-    Super Admin Dashboard - Platform overview with key metrics.
-    """
-    today = timezone.now().date()
+# Rows per page on the superadmin list views
+LIST_PAGE_SIZE = 50
+
+
+def _paginate(request, queryset, per_page=LIST_PAGE_SIZE):
+    """Requested page of queryset, plus the other GET params for building page links"""
+    page = Paginator(queryset, per_page).get_page(request.GET.get('page'))
+    params = request.GET.copy()
+    params.pop('page', None)
+    return page, params.urlencode()
+
+
+def _dashboard_stats(today):
+    """Platform-wide aggregates for the dashboard (cached, see DASHBOARD_CACHE_TIMEOUT)"""
     thirty_days_ago = today - timedelta(days=30)
     
-    # User Statistics
-    total_landlords = User.objects.filter(role='landlord').count()
-    total_tenants = User.objects.filter(role='tenant').count()
-    new_landlords_30d = User.objects.filter(
-        role='landlord', 
-        date_joined__gte=thirty_days_ago
-    ).count()
+    # User Statistics - one conditional aggregate
+    user_stats = User.objects.filter(role__in=['landlord', 'tenant']).aggregate(
+        landlords=Count('id', filter=Q(role='landlord')),
+        tenants=Count('id', filter=Q(role='tenant')),
+        new_landlords_30d=Count('id', filter=Q(role='landlord', date_joined__gte=thirty_days_ago))
+    )
     
     # Subscription Statistics
-    active_subscriptions = Subscription.objects.filter(
-        status__in=['active', 'trial']
-    ).count()
-    trial_subscriptions = Subscription.objects.filter(status='trial').count()
-    expired_subscriptions = Subscription.objects.filter(status='expired').count()
-    
-    # Revenue Statistics - using paid_at instead of payment_date
-    total_revenue = SubscriptionPayment.objects.filter(
-        status='completed'
-    ).aggregate(total=Sum('amount'))['total'] or 0
+    subscription_stats = Subscription.objects.aggregate(
+        active=Count('id', filter=Q(status__in=['active', 'trial'])),
+        trial=Count('id', filter=Q(status='trial')),
+        expired=Count('id', filter=Q(status='expired'))
+    )
     
-    revenue_30d = SubscriptionPayment.objects.filter(
-        status='completed',
-        paid_at__gte=thirty_days_ago
-    ).aggregate(total=Sum('amount'))['total'] or 0
+    # Revenue Statistics - read from the daily revenue summary
+    # Aliases must not reuse the 'total' field name, or the second Sum resolves to the first aggregate
+    revenue_stats = SubscriptionRevenueDaily.objects.aggregate(
+        revenue_total=Sum('total'),
+        revenue_30d=Sum('total', filter=Q(day__gte=thirty_days_ago))
+    )
     
     # Property Statistics
     total_properties = Property.objects.count()
-    total_units = Unit.objects.count()
-    # Count occupied units by checking if they have a lease
-    occupied_units = Unit.objects.filter(lease__isnull=False).distinct().count()
-    
-    # Platform Activity
-    total_payments = Payment.objects.count()
-    total_invoices = Invoice.objects.count()
-    
-    # Recent Landlords (last 10 signups)
-    recent_landlords = User.objects.filter(
-        role='landlord'
-    ).select_related('landlord_profile').order_by('-date_joined')[:10]
-    
-    # Subscriptions expiring soon (next 7 days)
-    seven_days_later = today + timedelta(days=7)
-    expiring_soon = Subscription.objects.filter(
-        end_date__lte=seven_days_later,
-        end_date__gte=today,
-        status__in=['active', 'trial']
-    ).select_related('landlord__user', 'plan')[:10]
+    # Total and occupied units in one pass - EXISTS probes leases instead of a DISTINCT join
+    unit_stats = Unit.objects.occupancy_stats()
+    total_units = unit_stats['total']
+    occupied_units = unit_stats['occupied']
     
-    # Monthly revenue trend (last 6 months) - using paid_at
+    # Monthly revenue trend (last 6 months) - rolled up from at most ~180 daily rows per plan
     six_months_ago = today - timedelta(days=180)
-    monthly_revenue = SubscriptionPayment.objects.filter(
-        status='completed',
-        paid_at__gte=six_months_ago
+    monthly_revenue = SubscriptionRevenueDaily.objects.filter(
+        day__gte=six_months_ago
     ).annotate(
-        month=TruncMonth('paid_at')
+        month=TruncMonth('day')
     ).values('month').annotate(
-        total=Sum('amount')
+        total=Sum('total')
     ).order_by('month')
     
-    context = {
+    return {
         # User Stats
-        'total_landlords': total_landlords,
-        'total_tenants': total_tenants,
-        'new_landlords_30d': new_landlords_30d,
+        'total_landlords': user_stats['landlords'],
+        'total_tenants': user_stats['tenants'],
+        'new_landlords_30d': user_stats['new_landlords_30d'],
         
         # Subscription Stats
-        'active_subscriptions': active_subscriptions,
-        'trial_subscriptions': trial_subscriptions,
-        'expired_subscriptions': expired_subscriptions,
+        'active_subscriptions': subscription_stats['active'],
+        'trial_subscriptions': subscription_stats['trial'],
+        'expired_subscriptions': subscription_stats['expired'],
         
         # Revenue Stats
-        'total_revenue': total_revenue,
-        'revenue_30d': revenue_30d,
+        'total_revenue': revenue_stats['revenue_total'] or 0,
+        'revenue_30d': revenue_stats['revenue_30d'] or 0,
         
         # Property Stats
         'total_properties': total_properties,
@@ -103,13 +95,46 @@ def dashboard(request):
         'occupancy_rate': round((occupied_units / total_units * 100) if total_units > 0 else 0, 1),
         
         # Activity Stats
-        'total_payments': total_payments,
-        'total_invoices': total_invoices,
+        'total_payments': Payment.objects.count(),
+        'total_invoices': Invoice.objects.count(),
+        
+        'monthly_revenue': list(monthly_revenue),
+    }
+
+
+@superadmin_required
+def dashboard(request):
+    """
+    Super Admin Dashboard - Platform overview with key metrics.
+    """
+    today = timezone.now().date()
+    
+    # Platform figures move on a minute scale, so the aggregates are served from cache
+    stats = cache.get_or_set(
+        f'superadmin:dashboard:{today.isoformat()}',
+        lambda: _dashboard_stats(today),
+        DASHBOARD_CACHE_TIMEOUT
+    )
+    
+    # Recent Landlords (last 10 signups)
+    recent_landlords = User.objects.filter(
+        role='landlord'
+    ).select_related('landlord_profile').order_by('-date_joined')[:10]
+    
+    # Subscriptions expiring soon (next 7 days)
+    seven_days_later = today + timedelta(days=7)
+    expiring_soon = Subscription.objects.filter(
+        end_date__lte=seven_days_later,
+        end_date__gte=today,
+        status__in=['active', 'trial']
+    ).select_related('landlord__user', 'plan')[:10]
+    
+    context = {
+        **stats,
         
         # Lists
         'recent_landlords': recent_landlords,
         'expiring_soon': expiring_soon,
-        'monthly_revenue': list(monthly_revenue),
     }
     
     return render(request, 'superadmin/dashboard.html', context)
@@ -124,7 +149,7 @@ def landlords_list(request):
     status_filter = request.GET.get('status', '')
     search_query = request.GET.get('search', '')
     
-    landlords = User.objects.filter(role='landlord').select_related('landlord_profile')
+    landlords = User.objects.filter(role='landlord')
     
     if search_query:
         landlords = landlords.filter(
@@ -133,39 +158,45 @@ def landlords_list(request):
             Q(landlord_profile__business_name__icontains=search_query)
         )
     
-    # Annotate with property and unit counts
+    # Apply status filter in the database before counting
+    if status_filter in ('active', 'trial', 'expired'):
+        landlords = landlords.filter(landlord_profile__subscription__status=status_filter)
+    elif status_filter == 'suspended':
+        landlords = landlords.filter(is_active_account=False)
+    
+    # Property and unit counts are read from the profile's denormalised counters
+    landlords = landlords.select_related(
+        'landlord_profile__subscription__plan'
+    ).only(
+        'id', 'username', 'email', 'date_joined', 'is_active_account',
+        'landlord_profile__business_name',
+        'landlord_profile__property_count',
+        'landlord_profile__unit_count',
+        'landlord_profile__subscription__status',
+        'landlord_profile__subscription__plan__name'
+    ).order_by('-date_joined')
+    
+    # Only the current page is materialised; the paginator counts with SELECT COUNT(*)
+    page, page_query = _paginate(request, landlords)
+    
     landlord_data = []
-    for landlord in landlords.order_by('-date_joined'):
+    for landlord in page:
         profile = getattr(landlord, 'landlord_profile', None)
-        subscription = profile.subscription if profile else None
-        
-        properties_count = Property.objects.filter(landlord=profile).count() if profile else 0
-        units_count = Unit.objects.filter(unit_property__landlord=profile).count() if profile else 0
-        tenants_count = 0  # Simplified - can be expanded later
-        
-        # Apply status filter
-        if status_filter:
-            if status_filter == 'active' and (not subscription or subscription.status != 'active'):
-                continue
-            elif status_filter == 'trial' and (not subscription or subscription.status != 'trial'):
-                continue
-            elif status_filter == 'expired' and (not subscription or subscription.status != 'expired'):
-                continue
-            elif status_filter == 'suspended' and landlord.is_active_account:
-                continue
         
         landlord_data.append({
             'user': landlord,
             'profile': profile,
-            'subscription': subscription,
-            'properties_count': properties_count,
-            'units_count': units_count,
-            'tenants_count': tenants_count,
+            'subscription': profile.subscription if profile else None,
+            'properties_count': profile.property_count if profile else 0,
+            'units_count': profile.unit_count if profile else 0,
+            'tenants_count': 0,  # Simplified - can be expanded later
         })
     
     context = {
         'landlords': landlord_data,
-        'total_count': len(landlord_data),
+        'total_count': page.paginator.count,
+        'page_obj': page,
+        'page_query': page_query,
         'status_filter': status_filter,
         'search_query': search_query,
     }
@@ -178,20 +209,27 @@ def landlord_detail(request, pk):
     """
     View detailed information about a specific landlord.
     """
-    landlord = get_object_or_404(User, pk=pk, role='landlord')
+    landlord = get_object_or_404(
+        User.objects.select_related('landlord_profile__subscription__plan'),
+        pk=pk,
+        role='landlord'
+    )
     profile = getattr(landlord, 'landlord_profile', None)
     
-    properties = Property.objects.filter(landlord=profile) if profile else []
+    properties = []
+    if profile:
+        # Unit counts annotated per property
+        properties = Property.objects.filter(landlord=profile).annotate(unit_count=Count('units'))
     
     # Get subscription history
     subscription_history = Subscription.objects.filter(
         landlord=profile
-    ).order_by('-created_at') if profile else []
+    ).select_related('plan').order_by('-created_at') if profile else []
     
     # Get payment history - using paid_at
     payment_history = SubscriptionPayment.objects.filter(
         subscription__landlord=profile
-    ).order_by('-paid_at')[:20] if profile else []
+    ).select_related('subscription__plan').order_by('-paid_at')[:20] if profile else []
     
     context = {
         'landlord': landlord,
@@ -209,14 +247,19 @@ def toggle_landlord_status(request, pk):
     """
     Suspend or activate a landlord account.
     """
-    landlord = get_object_or_404(User, pk=pk, role='landlord')
+    landlord = User.objects.filter(pk=pk, role='landlord')
+    # 404 for unknown or non-landlord users on any method; only two columns are read
+    username, was_active = get_object_or_404(landlord.values_list('username', 'is_active_account'))
     
     if request.method == 'POST':
-        landlord.is_active_account = not landlord.is_active_account
-        landlord.save()
-        
-        status = 'activated' if landlord.is_active_account else 'suspended'
-        messages.success(request, f'Landlord account {landlord.username} has been {status}.')
+        # Flip the flag in SQL rather than loading and re-saving the whole user row
+        landlord.update(is_active_account=Case(
+            When(is_active_account=True, then=Value(False)),
+            default=Value(True),
+            output_field=BooleanField()
+        ))
+        status = 'suspended' if was_active else 'activated'
+        messages.success(request, f'Landlord account {username} has been {status}.')
     
     return redirect('superadmin:landlord_detail', pk=pk)
 
@@ -231,6 +274,10 @@ def subscriptions_list(request):
     
     subscriptions = Subscription.objects.select_related(
         'landlord__user', 'plan'
+    ).only(
+        'id', 'status', 'start_date', 'end_date', 'created_at',
+        'landlord__user__username', 'landlord__user__email',
+        'plan__name', 'plan__monthly_price'
     ).order_by('-created_at')
     
     if status_filter:
@@ -241,19 +288,23 @@ def subscriptions_list(request):
     
     plans = SubscriptionPlan.objects.filter(is_active=True)
     
-    # Calculate stats
-    total_active = subscriptions.filter(status='active').count()
-    total_trial = subscriptions.filter(status='trial').count()
-    total_expired = subscriptions.filter(status='expired').count()
+    # Calculate stats - one conditional aggregate over the filtered set, without the ORDER BY
+    stats = subscriptions.order_by().aggregate(
+        total_active=Count('id', filter=Q(status='active')),
+        total_trial=Count('id', filter=Q(status='trial')),
+        total_expired=Count('id', filter=Q(status='expired'))
+    )
+    
+    page, page_query = _paginate(request, subscriptions)
     
     context = {
-        'subscriptions': subscriptions,
+        'subscriptions': page,
+        'page_obj': page,
+        'page_query': page_query,
         'plans': plans,
         'status_filter': status_filter,
         'plan_filter': plan_filter,
-        'total_active': total_active,
-        'total_trial': total_trial,
-        'total_expired': total_expired,
+        **stats,
     }
     
     return render(request, 'superadmin/subscriptions.html', context)
@@ -267,17 +318,16 @@ def subscription_plans(request):
     # Using monthly_price instead of price
     plans = SubscriptionPlan.objects.all().order_by('monthly_price')
     
-    # Count subscribers per plan
-    plan_data = []
-    for plan in plans:
-        subscriber_count = Subscription.objects.filter(
-            plan=plan, 
-            status__in=['active', 'trial']
-        ).count()
-        plan_data.append({
-            'plan': plan,
-            'subscriber_count': subscriber_count,
-        })
+    # Count subscribers per plan - one GROUP BY instead of a COUNT per plan
+    subscriber_counts = dict(Subscription.objects.filter(
+        status__in=['active', 'trial']
+    ).order_by().values('plan_id').annotate(
+        subscribers=Count('id')
+    ).values_list('plan_id', 'subscribers'))
+    plan_data = [
+        {'plan': plan, 'subscriber_count': subscriber_counts.get(plan.id, 0)}
+        for plan in plans
+    ]
     
     context = {
         'plans': plan_data,
@@ -286,6 +336,45 @@ def subscription_plans(request):
     return render(request, 'superadmin/subscription_plans.html', context)
 
 
+def _revenue_report_data(start_date):
+    """Subscription revenue totals, per-plan and per-day breakdowns since start_date"""
+    # Revenue data - read from the daily revenue summary
+    revenue = SubscriptionRevenueDaily.objects.filter(day__gte=start_date)
+    
+    totals = revenue.aggregate(total=Sum('total'), count=Sum('payment_count'))
+    total_revenue = totals['total'] or 0
+    payment_count = totals['count'] or 0
+    
+    # Nothing was paid in the period, so the breakdowns would be empty anyway
+    if not payment_count:
+        return {
+            'total_revenue': 0,
+            'payment_count': 0,
+            'revenue_by_plan': [],
+            'daily_revenue': [],
+        }
+    
+    # Revenue by plan
+    revenue_by_plan = revenue.values(
+        'plan__name'
+    ).annotate(
+        total=Sum('total'),
+        count=Sum('payment_count')
+    ).order_by('-total')
+    
+    # Daily revenue
+    daily_revenue = revenue.values(payment_date=F('day')).annotate(
+        total=Sum('total')
+    ).order_by('payment_date')
+    
+    return {
+        'total_revenue': total_revenue,
+        'payment_count': payment_count,
+        'revenue_by_plan': list(revenue_by_plan),
+        'daily_revenue': list(daily_revenue),
+    }
+
+
 @superadmin_required
 def revenue_report(request):
     """
@@ -302,33 +391,15 @@ def revenue_report(request):
     
     start_date = today - timedelta(days=days)
     
-    # Revenue data - using paid_at
-    payments = SubscriptionPayment.objects.filter(
-        status='completed',
-        paid_at__gte=start_date
+    # Revenue figures for a period are cached briefly, keyed by the period and day
+    report = cache.get_or_set(
+        f'superadmin:revenue:{start_date.isoformat()}',
+        lambda: _revenue_report_data(start_date),
+        REVENUE_CACHE_TIMEOUT
     )
     
-    total_revenue = payments.aggregate(total=Sum('amount'))['total'] or 0
-    payment_count = payments.count()
-    
-    # Revenue by plan
-    revenue_by_plan = payments.values(
-        'subscription__plan__name'
-    ).annotate(
-        total=Sum('amount'),
-        count=Count('id')
-    ).order_by('-total')
-    
-    # Daily revenue - using paid_at
-    daily_revenue = payments.values('paid_at__date').annotate(
-        total=Sum('amount')
-    ).order_by('paid_at__date')
-    
     context = {
-        'total_revenue': total_revenue,
-        'payment_count': payment_count,
-        'revenue_by_plan': revenue_by_plan,
-        'daily_revenue': list(daily_revenue),
+        **report,
         'period': period,
         'start_date': start_date,
     }
@@ -359,9 +430,14 @@ def activity_log(request):
     View recent system activity.
     """
     # Recent logins, signups, payments, etc.
-    recent_users = User.objects.order_by('-date_joined')[:50]
+    recent_users = User.objects.only(
+        'id', 'username', 'email', 'role', 'date_joined'
+    ).order_by('-date_joined')[:50]
     recent_payments = SubscriptionPayment.objects.select_related(
         'subscription__landlord__user'
+    ).only(
+        'id', 'amount', 'payment_method', 'paid_at',
+        'subscription__landlord__user__username'
     ).order_by('-paid_at')[:50]
     
     context = {
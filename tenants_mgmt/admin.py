@@ -1,5 +1,11 @@
 from django.contrib import admin
-from .models import Lease
+from django.db import transaction
+from .models import Lease, invalidate_unit_availability
+
+
+def _landlord_ids(queryset):
+    """Landlords whose cached availability an update() on these leases changes"""
+    return set(queryset.order_by().values_list('unit__unit_property__landlord_id', flat=True))
 
 
 @admin.register(Lease)
@@ -13,12 +19,14 @@ class LeaseAdmin(admin.ModelAdmin):
         'status',
         'rent_amount',
         'deposit_paid',
+        'rent_paid',
+        'arrears',
         'created_at'
     ]
     list_filter = ['status', 'deposit_paid', 'start_date', 'created_at']
     search_fields = [
         'unit__unit_number', 
-        'unit__property__name',
+        'unit__unit_property__name',
         'tenant__user__username',
         'tenant__user__first_name',
         'tenant__user__last_name'
@@ -50,16 +58,38 @@ class LeaseAdmin(admin.ModelAdmin):
     
     actions = ['activate_leases', 'terminate_leases']
     
+    def get_queryset(self, request):
+        # Rent paid / arrears come annotated instead of two aggregate queries per row, and
+        # the unit/property/landlord chain behind __str__ and Lease.landlord is joined up front
+        return super().get_queryset(request).select_related(
+            'unit__unit_property__landlord__user',
+            'tenant__user'
+        ).with_financials()
+    
+    @admin.display(description='Rent paid', ordering='total_rent_paid')
+    def rent_paid(self, obj):
+        return obj.total_rent_paid
+    
+    @admin.display(description='Arrears', ordering='total_arrears')
+    def arrears(self, obj):
+        return obj.total_arrears
+    
+    @transaction.atomic
     def activate_leases(self, request, queryset):
+        landlord_ids = _landlord_ids(queryset)
         updated = queryset.update(status='active')
+        # update() skips the Lease signals; the cache is cleared once this commits
+        invalidate_unit_availability(*landlord_ids)
         self.message_user(request, f'{updated} lease(s) activated.')
     activate_leases.short_description = 'Activate selected leases'
     
+    @transaction.atomic
     def terminate_leases(self, request, queryset):
         from django.utils import timezone
-        count = 0
-        for lease in queryset:
-            lease.terminate_lease(timezone.now().date())
-            count += 1
+        now = timezone.now()
+        landlord_ids = _landlord_ids(queryset)
+        # Same fields as Lease.terminate_lease(), written in a single UPDATE
+        count = queryset.update(status='terminated', move_out_date=now.date(), updated_at=now)
+        invalidate_unit_availability(*landlord_ids)
         self.message_user(request, f'{count} lease(s) terminated.')
     terminate_leases.short_description = 'Terminate selected leases'
\ No newline at end of file
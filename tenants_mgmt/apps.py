@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class TenantsMgmtConfig(AppConfig):
     name = 'tenants_mgmt'
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.7 on 2026-10-16 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tenants_mgmt', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='lease',
+            index=models.Index(condition=models.Q(('status', 'active')), fields=['unit'], name='lease_active_unit_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lease',
+            index=models.Index(fields=['status', 'tenant'], name='lease_status_tenant_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lease',
+            index=models.Index(fields=['status', '-move_out_date'], name='lease_status_moveout_idx'),
+        ),
+    ]
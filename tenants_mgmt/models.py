@@ -1,9 +1,42 @@
-from django.db import models
+from django.core.cache import cache
+from django.db import models, transaction
 from django.utils import timezone
 from accounts.models import TenantProfile
 from properties.models import Unit
 
 
+# Per-landlord unit availability, cached for the tenant/lease forms
+VACANT_UNITS_CACHE_KEY = 'vacant_units:{}'
+OCCUPIED_COUNT_CACHE_KEY = 'occupied_count:{}'
+UNIT_AVAILABILITY_CACHE_TIMEOUT = 3600
+
+
+def invalidate_unit_availability(*landlord_ids):
+    """Drop the cached vacant units / occupied count once the current transaction commits"""
+    keys = [
+        key.format(landlord_id)
+        for landlord_id in landlord_ids if landlord_id is not None
+        for key in (VACANT_UNITS_CACHE_KEY, OCCUPIED_COUNT_CACHE_KEY)
+    ]
+    if keys:
+        transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+class LeaseQuerySet(models.QuerySet):
+    def with_financials(self):
+        """Annotate rent paid and outstanding arrears per lease in one grouped query"""
+        return self.annotate(
+            total_rent_paid=models.Sum(
+                'invoices__amount_paid',
+                filter=models.Q(invoices__status='paid')
+            ),
+            total_arrears=models.Sum(
+                models.F('invoices__total_amount') - models.F('invoices__amount_paid'),
+                filter=models.Q(invoices__status__in=['pending', 'overdue', 'partial'])
+            ),
+        )
+
+
 class Lease(models.Model):
     """
     Lease agreement linking a tenant to a unit.
@@ -49,11 +82,19 @@ class Lease(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = LeaseQuerySet.as_manager()
+    
     class Meta:
         db_table = 'leases'
         ordering = ['-start_date']
         verbose_name = 'Lease'
         verbose_name_plural = 'Leases'
+        indexes = [
+            # Only live leases - backs every "is this unit occupied?" EXISTS check
+            models.Index(fields=['unit'], condition=models.Q(status='active'), name='lease_active_unit_idx'),
+            models.Index(fields=['status', 'tenant'], name='lease_status_tenant_idx'),
+            models.Index(fields=['status', '-move_out_date'], name='lease_status_moveout_idx'),
+        ]
     
     def __str__(self):
         return f"{self.unit} - {self.tenant.user.get_full_name()}"
@@ -67,7 +108,7 @@ class Lease(models.Model):
     @property
     def landlord(self):
         """Get landlord from unit's property"""
-        return self.unit.property.landlord
+        return self.unit.unit_property.landlord
     
     @property
     def is_active(self):
@@ -90,6 +131,9 @@ class Lease(models.Model):
     @property
     def total_rent_paid(self):
         """Calculate total rent paid through invoices"""
+        # Prefer the value annotated by Lease.objects.with_financials()
+        if '_total_rent_paid' in self.__dict__:
+            return self._total_rent_paid or 0
         from invoicing.models import Invoice
         from django.db.models import Sum
         
@@ -100,9 +144,15 @@ class Lease(models.Model):
         
         return total or 0
     
+    @total_rent_paid.setter
+    def total_rent_paid(self, value):
+        self._total_rent_paid = value
+    
     @property
     def total_arrears(self):
         """Calculate total outstanding arrears"""
+        if '_total_arrears' in self.__dict__:
+            return self._total_arrears or 0
         from invoicing.models import Invoice
         from django.db.models import Sum, F
         
@@ -115,8 +165,12 @@ class Lease(models.Model):
         
         return arrears or 0
     
+    @total_arrears.setter
+    def total_arrears(self, value):
+        self._total_arrears = value
+    
     def terminate_lease(self, termination_date=None):
         """Terminate lease and mark as terminated"""
         self.status = 'terminated'
         self.move_out_date = termination_date or timezone.now().date()
-        self.save()
\ No newline at end of file
+        self.save(update_fields=['status', 'move_out_date', 'updated_at'])
\ No newline at end of file
@@ -0,0 +1,21 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from properties.models import Property, Unit
+from .models import Lease, invalidate_unit_availability
+
+
+@receiver([post_save, post_delete], sender=Lease)
+def lease_changed(sender, instance, **kwargs):
+    """New, terminated or deleted leases change which of the landlord's units are vacant"""
+    landlord_id = Unit.objects.filter(pk=instance.unit_id).values_list(
+        'unit_property__landlord_id', flat=True
+    ).first()
+    invalidate_unit_availability(landlord_id)
+
+
+@receiver([post_save, post_delete], sender=Unit)
+def unit_changed(sender, instance, **kwargs):
+    landlord_id = Property.objects.filter(pk=instance.unit_property_id).values_list(
+        'landlord_id', flat=True
+    ).first()
+    invalidate_unit_availability(landlord_id)
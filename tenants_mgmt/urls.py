@@ -1,16 +1,17 @@
 from django.urls import path
+from core.decorators import landlord_required
 from . import views
 
 app_name = 'tenants'
 
 urlpatterns = [
-    path('', views.TenantListView.as_view(), name='list'),
-    path('create/', views.TenantCreateView.as_view(), name='create'),
-    path('<int:pk>/', views.TenantDetailView.as_view(), name='detail'),
-    path('<int:pk>/edit/', views.TenantUpdateView.as_view(), name='update'),
-    path('<int:pk>/delete/', views.TenantDeleteView.as_view(), name='delete'),
-    path('lease/create/', views.LeaseCreateView.as_view(), name='lease_create'),
-    path('lease/<int:pk>/terminate/', views.LeaseTerminateView.as_view(), name='lease_terminate'),
+    path('', landlord_required(views.TenantListView.as_view()), name='list'),
+    path('create/', landlord_required(views.TenantCreateView.as_view()), name='create'),
+    path('<int:pk>/', landlord_required(views.TenantDetailView.as_view()), name='detail'),
+    path('<int:pk>/edit/', landlord_required(views.TenantUpdateView.as_view()), name='update'),
+    path('<int:pk>/delete/', landlord_required(views.TenantDeleteView.as_view()), name='delete'),
+    path('lease/create/', landlord_required(views.LeaseCreateView.as_view()), name='lease_create'),
+    path('lease/<int:pk>/terminate/', landlord_required(views.LeaseTerminateView.as_view()), name='lease_terminate'),
     
     # Tenant Portal
     path('portal/', views.TenantPortalView.as_view(), name='portal'),
@@ -2,28 +2,76 @@ from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.views import View
 from django.contrib import messages
+from django.http import Http404
 from django.utils import timezone
 from django.db import transaction
-from .models import Lease
+from django.db.models import BooleanField, Case, Exists, F, OuterRef, Prefetch, Q, Sum, Value, When
+from django.core.cache import cache
+from .models import Lease, OCCUPIED_COUNT_CACHE_KEY, UNIT_AVAILABILITY_CACHE_TIMEOUT, VACANT_UNITS_CACHE_KEY
 from accounts.models import User, TenantProfile
 from properties.models import Unit
 from invoicing.models import Invoice
-import random
-import string
+import secrets
+
+# Lease, tenant and unit columns rendered in the tenant list tables
+ACTIVE_LEASE_ROW_FIELDS = [
+    'id', 'rent_amount', 'start_date', 'move_in_date',
+    'tenant__user__first_name', 'tenant__user__last_name', 'tenant__user__email', 'tenant__user__phone_number',
+    'unit__unit_number', 'unit__unit_property__name',
+]
+INACTIVE_LEASE_ROW_FIELDS = [
+    'id', 'status', 'move_out_date',
+    'tenant__user__first_name', 'tenant__user__last_name',
+    'unit__unit_number', 'unit__unit_property__name',
+]
+
+# Invoice columns rendered in the tenant detail and portal invoice tables
+INVOICE_ROW_FIELDS = [
+    'id', 'invoice_number', 'billing_month', 'due_date', 'total_amount', 'amount_paid', 'status',
+]
+
+# Characters dropped from a phone number when deriving the tenant username
+_PHONE_STRIP = str.maketrans('', '', '+ -()')
+
+# User and tenant profile fields the tenant edit form can change
+TENANT_USER_FIELDS = ('first_name', 'last_name', 'email', 'phone_number')
+TENANT_PROFILE_FIELDS = ('national_id', 'emergency_contact', 'emergency_contact_name')
+
+
+def _vacant_units(landlord):
+    """Landlord's units without an active lease, as a list; the id list is cached until a lease or unit changes"""
+    key = VACANT_UNITS_CACHE_KEY.format(landlord.pk)
+    vacant_ids = cache.get(key)
+    if vacant_ids is None:
+        vacant_ids = list(Unit.objects.filter(
+            unit_property__landlord=landlord
+        ).vacant().values_list('pk', flat=True))
+        cache.set(key, vacant_ids, UNIT_AVAILABILITY_CACHE_TIMEOUT)
+    if not vacant_ids:
+        return []
+    return list(Unit.objects.filter(pk__in=vacant_ids).select_related('unit_property'))
 
 
-class TenantListView(LoginRequiredMixin, View):
-    """List all tenants for the landlord"""
+def _invoice_rows():
+    """Invoice table rows with balance and arrears flag annotated, newest first"""
+    return Invoice.objects.with_balance().annotate(
+        is_arrear=Case(When(balance__gt=0, then=Value(True)), default=Value(False), output_field=BooleanField())
+    ).only(*INVOICE_ROW_FIELDS).order_by('-billing_month')
 
-    def get(self, request):
-        if not request.user.is_landlord:
-            messages.error(request, 'Access denied.')
-            return redirect('demo:home')
 
-        if not request.landlord:
-            messages.error(request, 'Landlord profile not found.')
-            return redirect('demo:home')
+def _invoice_totals(lease):
+    """Paid, billed and outstanding totals for a lease's invoices in one aggregate"""
+    return Invoice.objects.with_balance().filter(lease=lease).aggregate(
+        total_paid=Sum('amount_paid'),
+        total_owed=Sum('total_amount'),
+        total_arrears=Sum('balance', filter=Q(balance__gt=0)),
+    )
 
+
+class TenantListView(View):
+    """List all tenants for the landlord"""
+
+    def get(self, request):
         # Get all active leases for this landlord
         active_leases = Lease.objects.filter(
             unit__unit_property__landlord=request.landlord,
@@ -31,7 +79,7 @@ class TenantListView(LoginRequiredMixin, View):
         ).select_related(
             'tenant__user',
             'unit__unit_property'
-        ).order_by('tenant__user__first_name')
+        ).only(*ACTIVE_LEASE_ROW_FIELDS).order_by('tenant__user__first_name')
 
         # Get all terminated/expired leases
         inactive_leases = Lease.objects.filter(
@@ -40,7 +88,7 @@ class TenantListView(LoginRequiredMixin, View):
         ).select_related(
             'tenant__user',
             'unit__unit_property'
-        ).order_by('-move_out_date')[:10]
+        ).only(*INACTIVE_LEASE_ROW_FIELDS).order_by('-move_out_date')[:10]
 
         context = {
             'active_leases': active_leases,
@@ -50,29 +98,24 @@ class TenantListView(LoginRequiredMixin, View):
         return render(request, 'landlord/tenant_list.html', context)
 
 
-class TenantCreateView(LoginRequiredMixin, View):
+class TenantCreateView(View):
     """Create a new tenant and assign to a unit (lease)"""
 
     def get(self, request):
-        if not request.user.is_landlord:
-            messages.error(request, 'Access denied. You must be a landlord.')
-            return redirect('demo:home')
-
-        if not request.landlord:
-            messages.error(request, 'Landlord profile not found. Please contact support.')
-            return redirect('demo:home')
-
         landlord = request.landlord
 
         # Check subscription limit
         if landlord.subscription:
             units_limit = landlord.subscription.plan.max_units
 
-            # Count current occupied units
-            occupied_count = Unit.objects.filter(
-                unit_property__landlord=landlord,
-                lease__status='active'
-            ).distinct().count()
+            # Count current occupied units (cached until a lease or unit changes)
+            occupied_count = cache.get_or_set(
+                OCCUPIED_COUNT_CACHE_KEY.format(landlord.pk),
+                lambda: Unit.objects.filter(
+                    unit_property__landlord=landlord
+                ).occupied().count(),
+                UNIT_AVAILABILITY_CACHE_TIMEOUT
+            )
 
             if occupied_count >= units_limit:
                 messages.error(
@@ -83,13 +126,9 @@ class TenantCreateView(LoginRequiredMixin, View):
                 return redirect('subscriptions:plans')
 
         # Get vacant units for this landlord
-        vacant_units = Unit.objects.filter(
-            unit_property__landlord=landlord
-        ).exclude(
-            lease__status='active'
-        ).select_related('unit_property')
+        vacant_units = _vacant_units(landlord)
 
-        if not vacant_units.exists():
+        if not vacant_units:
             messages.warning(request, 'No vacant units available. All units are occupied.')
             return redirect('tenants:list')
 
@@ -99,14 +138,6 @@ class TenantCreateView(LoginRequiredMixin, View):
 
     @transaction.atomic
     def post(self, request):
-        if not request.user.is_landlord:
-            messages.error(request, 'Access denied.')
-            return redirect('demo:home')
-
-        if not request.landlord:
-            messages.error(request, 'Landlord profile not found.')
-            return redirect('demo:home')
-
         # Tenant personal information
         first_name = request.POST.get('first_name', '').strip()
         last_name = request.POST.get('last_name', '').strip()
@@ -127,9 +158,9 @@ class TenantCreateView(LoginRequiredMixin, View):
             messages.error(request, 'Please fill all required fields.')
             return redirect('tenants:create')
 
-        # Get unit and verify ownership
+        # Get unit, verify ownership and check occupancy in one query
         try:
-            unit = Unit.objects.get(
+            unit = Unit.objects.with_active_lease().get(
                 pk=unit_id,
                 unit_property__landlord=request.landlord
             )
@@ -137,27 +168,31 @@ class TenantCreateView(LoginRequiredMixin, View):
             messages.error(request, 'Invalid unit selected.')
             return redirect('tenants:create')
 
-        # Check if unit has an active lease
-        if Lease.objects.filter(unit=unit, status='active').exists():
+        if unit.has_active_lease:
             messages.error(request, 'This unit is already occupied.')
             return redirect('tenants:create')
 
         # Generate username from phone number
-        clean_phone = phone_number.replace('+', '').replace(' ', '').replace('-', '').replace('(', '').replace(')', '')
+        clean_phone = phone_number.translate(_PHONE_STRIP)
         username = f"tenant_{clean_phone}"
 
-        # Check if user with this username exists
-        if User.objects.filter(username=username).exists():
+        # Check for an existing username or email in a single lookup
+        user_lookup = Q(username=username)
+        if email:
+            user_lookup |= Q(email=email)
+        existing = set(User.objects.filter(user_lookup).values_list('username', flat=True))
+
+        if username in existing:
             messages.error(request, 'A tenant with this phone number already exists.')
             return redirect('tenants:create')
 
-        if email and User.objects.filter(email=email).exists():
+        if existing:
             messages.error(request, 'A user with this email already exists.')
             return redirect('tenants:create')
 
         try:
             # Generate a random but secure password
-            password = ''.join(random.choices(string.ascii_letters + string.digits, k=10))
+            password = secrets.token_urlsafe(8)
 
             # Create tenant user account
             tenant_user = User.objects.create_user(
@@ -207,59 +242,39 @@ class TenantCreateView(LoginRequiredMixin, View):
             return redirect('tenants:create')
 
 
-class TenantDetailView(LoginRequiredMixin, View):
+class TenantDetailView(View):
     """View tenant details and lease information"""
 
     def get(self, request, pk):
-        if not request.user.is_landlord:
-            messages.error(request, 'Access denied.')
-            return redirect('demo:home')
-
-        if not request.landlord:
-            messages.error(request, 'Landlord profile not found.')
-            return redirect('demo:home')
-
         lease = get_object_or_404(
-            Lease,
+            Lease.objects.select_related('tenant__user', 'unit__unit_property'),
             pk=pk,
             unit__unit_property__landlord=request.landlord
         )
 
-        # Get tenant's invoices
-        invoices = Invoice.objects.filter(
-            lease=lease
-        ).order_by('-billing_month')
+        # Get tenant's invoices - only the columns the table shows, balance computed in SQL
+        invoices = _invoice_rows().filter(lease=lease)
 
-        # Calculate payment statistics
-        total_paid = sum(inv.amount_paid for inv in invoices)
-        total_owed = sum(inv.total_amount for inv in invoices)
-        total_arrears = sum(inv.balance for inv in invoices if inv.balance > 0)
+        # Calculate payment statistics in the database
+        stats = _invoice_totals(lease)
 
         context = {
             'lease': lease,
             'invoices': invoices,
-            'total_paid': total_paid,
-            'total_owed': total_owed,
-            'total_arrears': total_arrears,
+            'total_paid': stats['total_paid'] or 0,
+            'total_owed': stats['total_owed'] or 0,
+            'total_arrears': stats['total_arrears'] or 0,
         }
 
         return render(request, 'landlord/tenant_detail.html', context)
 
 
-class TenantUpdateView(LoginRequiredMixin, View):
+class TenantUpdateView(View):
     """Update tenant information"""
 
     def get(self, request, pk):
-        if not request.user.is_landlord:
-            messages.error(request, 'Access denied.')
-            return redirect('demo:home')
-
-        if not request.landlord:
-            messages.error(request, 'Landlord profile not found.')
-            return redirect('demo:home')
-
         lease = get_object_or_404(
-            Lease,
+            Lease.objects.select_related('tenant__user', 'unit__unit_property'),
             pk=pk,
             unit__unit_property__landlord=request.landlord
         )
@@ -270,103 +285,70 @@ class TenantUpdateView(LoginRequiredMixin, View):
         })
 
     def post(self, request, pk):
-        if not request.user.is_landlord:
-            messages.error(request, 'Access denied.')
-            return redirect('demo:home')
-
-        if not request.landlord:
-            messages.error(request, 'Landlord profile not found.')
-            return redirect('demo:home')
-
-        lease = get_object_or_404(
-            Lease,
+        tenant_id, user_id = get_object_or_404(
+            Lease.objects.values_list('tenant_id', 'tenant__user_id'),
             pk=pk,
             unit__unit_property__landlord=request.landlord
         )
 
-        tenant_user = lease.tenant.user
-        tenant_profile = lease.tenant
-
-        # Update tenant personal information
-        tenant_user.first_name = request.POST.get('first_name', tenant_user.first_name)
-        tenant_user.last_name = request.POST.get('last_name', tenant_user.last_name)
-        tenant_user.email = request.POST.get('email', tenant_user.email)
-        tenant_user.phone_number = request.POST.get('phone_number', tenant_user.phone_number)
-        tenant_user.save()
+        # Write only the submitted fields, without loading the rows first
+        user_updates = {f: request.POST[f] for f in TENANT_USER_FIELDS if f in request.POST}
+        if user_updates:
+            User.objects.filter(pk=user_id).update(**user_updates)
 
-        tenant_profile.national_id = request.POST.get('national_id', tenant_profile.national_id)
-        tenant_profile.emergency_contact = request.POST.get('emergency_contact', tenant_profile.emergency_contact)
-        tenant_profile.emergency_contact_name = request.POST.get('emergency_contact_name', tenant_profile.emergency_contact_name)
-        tenant_profile.save()
+        profile_updates = {f: request.POST[f] for f in TENANT_PROFILE_FIELDS if f in request.POST}
+        if profile_updates:
+            TenantProfile.objects.filter(pk=tenant_id).update(updated_at=timezone.now(), **profile_updates)
 
         messages.success(request, 'Tenant information updated successfully!')
         return redirect('tenants:detail', pk=pk)
 
 
-class TenantDeleteView(LoginRequiredMixin, View):
+class TenantDeleteView(View):
     """Delete tenant (only if no invoices/payments exist)"""
 
+    @transaction.atomic
     def post(self, request, pk):
-        if not request.user.is_landlord:
-            messages.error(request, 'Access denied.')
-            return redirect('demo:home')
-
-        if not request.landlord:
-            messages.error(request, 'Landlord profile not found.')
-            return redirect('demo:home')
-
+        # Lease, tenant user and invoice check in one query
         lease = get_object_or_404(
-            Lease,
+            Lease.objects.select_related('tenant__user').annotate(
+                has_invoices=Exists(Invoice.objects.filter(lease__tenant=OuterRef('tenant')))
+            ),
             pk=pk,
             unit__unit_property__landlord=request.landlord
         )
 
         # Check if tenant has invoices
-        if Invoice.objects.filter(lease=lease).exists():
+        if lease.has_invoices:
             messages.error(
                 request,
                 'Cannot delete tenant with existing invoices. Terminate lease instead.'
             )
             return redirect('tenants:detail', pk=pk)
 
-        tenant_name = lease.tenant.user.get_full_name()
         tenant_user = lease.tenant.user
-        tenant_profile = lease.tenant
+        tenant_name = tenant_user.get_full_name()
 
-        # Delete lease, profile, and user
-        lease.delete()
-        tenant_profile.delete()
+        # Deleting the user cascades to the tenant profile and its leases
         tenant_user.delete()
 
         messages.success(request, f'Tenant "{tenant_name}" deleted successfully!')
         return redirect('tenants:list')
 
 
-class LeaseCreateView(LoginRequiredMixin, View):
+class LeaseCreateView(View):
     """Create a new lease for existing tenant"""
 
     def get(self, request):
-        if not request.user.is_landlord:
-            messages.error(request, 'Access denied.')
-            return redirect('demo:home')
-
-        if not request.landlord:
-            messages.error(request, 'Landlord profile not found.')
-            return redirect('demo:home')
-
         # Get all tenant profiles
         tenants = TenantProfile.objects.filter(
             leases__unit__unit_property__landlord=request.landlord
         ).distinct().select_related('user')
 
         # Get vacant units
-        vacant_units = Unit.objects.filter(
-            unit_property__landlord=request.landlord
-        ).exclude(
-            lease__status='active'
-        ).select_related('unit_property')
+        vacant_units = _vacant_units(request.landlord)
 
-        if not vacant_units.exists():
+        if not vacant_units:
             messages.warning(request, 'No vacant units available.')
             return redirect('tenants:list')
 
@@ -376,14 +358,6 @@ class LeaseCreateView(LoginRequiredMixin, View):
         })
 
     def post(self, request):
-        if not request.user.is_landlord:
-            messages.error(request, 'Access denied.')
-            return redirect('demo:home')
-
-        if not request.landlord:
-            messages.error(request, 'Landlord profile not found.')
-            return redirect('demo:home')
-
         tenant_id = request.POST.get('tenant')
         unit_id = request.POST.get('unit')
         start_date = request.POST.get('start_date')
@@ -394,25 +368,31 @@ class LeaseCreateView(LoginRequiredMixin, View):
             messages.error(request, 'Please fill all required fields.')
             return redirect('tenants:lease_create')
 
-        tenant = get_object_or_404(TenantProfile, pk=tenant_id)
+        # Unit ownership, tenant existence and both occupancy checks in one query
         unit = get_object_or_404(
-            Unit,
+            Unit.objects.with_active_lease().annotate(
+                tenant_exists=Exists(TenantProfile.objects.filter(pk=tenant_id)),
+                tenant_has_lease=Exists(Lease.objects.filter(tenant_id=tenant_id, status='active')),
+            ),
             pk=unit_id,
             unit_property__landlord=request.landlord
         )
 
-        if Lease.objects.filter(unit=unit, status='active').exists():
+        if not unit.tenant_exists:
+            raise Http404('No TenantProfile matches the given query.')
+
+        if unit.has_active_lease:
             messages.error(request, 'This unit is already occupied.')
             return redirect('tenants:lease_create')
 
         # Check if tenant already has active lease
-        if Lease.objects.filter(tenant=tenant, status='active').exists():
+        if unit.tenant_has_lease:
             messages.error(request, 'This tenant already has an active lease.')
             return redirect('tenants:lease_create')
 
         lease = Lease.objects.create(
             unit=unit,
-            tenant=tenant,
+            tenant_id=tenant_id,
             start_date=start_date,
             status='active',
             rent_amount=unit.monthly_rent,
@@ -426,18 +406,10 @@ class LeaseCreateView(LoginRequiredMixin, View):
         return redirect('tenants:detail', pk=lease.pk)
 
 
-class LeaseTerminateView(LoginRequiredMixin, View):
+class LeaseTerminateView(View):
     """Terminate a lease"""
 
     def post(self, request, pk):
-        if not request.user.is_landlord:
-            messages.error(request, 'Access denied.')
-            return redirect('demo:home')
-
-        if not request.landlord:
-            messages.error(request, 'Landlord profile not found.')
-            return redirect('demo:home')
-
         lease = get_object_or_404(
             Lease,
             pk=pk,
@@ -450,14 +422,13 @@ class LeaseTerminateView(LoginRequiredMixin, View):
 
         termination_date = request.POST.get('termination_date', timezone.now().date())
 
-        # Check for unpaid invoices
-        unpaid_invoices = Invoice.objects.filter(
+        # Sum outstanding balances on unpaid invoices in the database
+        total_arrears = Invoice.objects.with_balance().filter(
             lease=lease,
             status__in=['pending', 'overdue', 'partial']
-        )
+        ).aggregate(total=Sum('balance'))['total'] or 0
 
-        if unpaid_invoices.exists():
-            total_arrears = sum(inv.balance for inv in unpaid_invoices)
+        if total_arrears:
             messages.warning(
                 request,
                 f'Warning: Tenant has outstanding arrears of KES {total_arrears:,.2f}'
@@ -479,18 +450,21 @@ class TenantPortalView(LoginRequiredMixin, View):
             messages.error(request, 'Access denied. Tenant account required.')
             return redirect('demo:home')
 
-        # Get tenant profile
-        try:
-            tenant_profile = request.user.tenant_profile
-        except TenantProfile.DoesNotExist:
-            messages.error(request, 'Tenant profile not found.')
-            return redirect('demo:home')
-
-        # Get active lease
+        # Active lease with its invoice totals and invoice rows, in one query plus a prefetch
         current_lease = Lease.objects.filter(
-            tenant=tenant_profile,
+            tenant__user=request.user,
             status='active'
-        ).select_related('unit__unit_property').first()
+        ).select_related('unit__unit_property__landlord__user').annotate(
+            invoices_paid=Sum('invoices__amount_paid'),
+            invoices_arrears=Sum(
+                F('invoices__total_amount') - F('invoices__amount_paid'),
+                filter=Q(invoices__total_amount__gt=F('invoices__amount_paid'))
+            ),
+        ).prefetch_related(Prefetch(
+            'invoices',
+            queryset=_invoice_rows().only('lease', *INVOICE_ROW_FIELDS),
+            to_attr='portal_invoices'
+        )).first()
 
         if not current_lease:
             return render(request, 'tenant/portal.html', {
@@ -500,20 +474,11 @@ class TenantPortalView(LoginRequiredMixin, View):
                 'total_arrears': 0,
             })
 
-        # Get invoices
-        invoices = Invoice.objects.filter(
-            lease=current_lease
-        ).order_by('-billing_month')
-
-        # Calculate statistics
-        total_paid = sum(inv.amount_paid for inv in invoices)
-        total_arrears = sum(inv.balance for inv in invoices if inv.balance > 0)
-
         context = {
             'current_lease': current_lease,
-            'invoices': invoices,
-            'total_paid': total_paid,
-            'total_arrears': total_arrears,
+            'invoices': current_lease.portal_invoices,
+            'total_paid': current_lease.invoices_paid or 0,
+            'total_arrears': current_lease.invoices_arrears or 0,
         }
 
         return render(request, 'tenant/portal.html', context)
\ No newline at end of file